@@ -0,0 +1,61 @@
+import argparse
+import time
+
+import numpy as np
+from PIL import Image
+
+from gif_analyzer import checkerboard_image, draw_checkerboard
+
+
+def putpixel_checkerboard(frame_image, cell_size=20):
+    # The per-pixel implementation draw_checkerboard_with_pillow used before
+    # the background was cached; kept as the reference point.
+    frame_width, frame_height = frame_image.size
+
+    checkerboard = Image.new("RGBA", (frame_width, frame_height), (255, 255, 255, 0))
+    for x in range(0, frame_width, cell_size):
+        for y in range(0, frame_height, cell_size):
+            if (x // cell_size + y // cell_size) % 2 == 0:
+                for dx in range(cell_size):
+                    for dy in range(cell_size):
+                        if x + dx < frame_width and y + dy < frame_height:
+                            checkerboard.putpixel((x + dx, y + dy), (192, 192, 192, 255))
+
+    checkerboard.paste(frame_image, (0, 0), frame_image)
+    return checkerboard
+
+
+def per_frame(func, frames) -> float:
+    start = time.perf_counter()
+    for frame in frames:
+        func(frame)
+    return (time.perf_counter() - start) / len(frames)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark checkerboard background rendering')
+    parser.add_argument('--size', type=int, nargs=2, default=(400, 300), metavar=('WIDTH', 'HEIGHT'))
+    parser.add_argument('--frames', type=int, default=10)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    width, height = args.size
+    frames = []
+    for _ in range(args.frames):
+        pixels = rng.integers(0, 256, (height, width, 4), dtype=np.uint8)
+        pixels[..., 3] = rng.choice([0, 255], (height, width))
+        frames.append(Image.fromarray(pixels, "RGBA"))
+
+    checkerboard_image.cache_clear()
+
+    before = per_frame(putpixel_checkerboard, frames)
+    after = per_frame(draw_checkerboard, frames)
+
+    print(f"{args.frames} frames, {width}x{height}")
+    print(f"putpixel loops:    {before * 1000:8.2f} ms/frame")
+    print(f"cached composite:  {after * 1000:8.2f} ms/frame")
+    print(f"speedup:           {before / after:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
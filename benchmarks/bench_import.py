@@ -0,0 +1,47 @@
+import argparse
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+HEAVY_MODULES = ('numpy', 'PIL', 'tkinter', 'customtkinter', 'sqlite3', 'concurrent', 'multiprocessing')
+
+
+def import_profile(module: str) -> Tuple[int, Dict[str, int]]:
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            capture_output=True, text=True, check=True)
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative_us, name = line.split('|')
+        cumulative[name.strip()] = int(cumulative_us)
+    return cumulative[module], cumulative
+
+
+def heavy_imports(cumulative: Dict[str, int]) -> List[str]:
+    return sorted(name for name in cumulative if name.split('.')[0] in HEAVY_MODULES and '.' not in name)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure cold import time with python -X importtime')
+    parser.add_argument('modules', nargs='*', default=['gif_parser', 'cli', 'gif_analyzer'])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--budget-ms', type=float, help='Fail if the best import time of a module exceeds this')
+    args = parser.parse_args()
+
+    over_budget = False
+    for module in args.modules:
+        runs = [import_profile(module) for _ in range(args.repeat)]
+        best_us, cumulative = min(runs, key=lambda run: run[0])
+        heavy = heavy_imports(cumulative)
+        print(f"{module + ':':14}{best_us / 1000:8.1f} ms  heavy: {', '.join(heavy) or '-'}")
+        if args.budget_ms is not None and best_us / 1000 > args.budget_ms:
+            over_budget = True
+
+    if over_budget:
+        print(f"import budget of {args.budget_ms} ms exceeded")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
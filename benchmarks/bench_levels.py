@@ -0,0 +1,34 @@
+import argparse
+import tempfile
+from pathlib import Path
+
+from benchmarks.bench_parser import best_of
+from benchmarks.gif_factory import make_gif
+from gif_parser import PARSE_LEVELS, GifParser
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark GifParser.parse_file levels on many-frame GIFs')
+    parser.add_argument('--frames', type=int, default=5000)
+    parser.add_argument('--size', type=int, nargs=2, default=(64, 64), metavar=('WIDTH', 'HEIGHT'))
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.gif"
+        path.write_bytes(make_gif(args.size[0], args.size[1], args.frames))
+        size_mb = path.stat().st_size / (1024 * 1024)
+
+        full = GifParser(path).parse_file()
+        summary = GifParser(path).parse_file('summary')
+        assert summary['headers']['Summary'] == full['headers']['Summary']
+
+        timings = {level: best_of(lambda: GifParser(path).parse_file(level), args.repeat) for level in PARSE_LEVELS}
+
+    print(f"{args.frames} frames, {args.size[0]}x{args.size[1]}, {size_mb:.1f} MB")
+    for level in PARSE_LEVELS:
+        print(f"{level + ':':9}{timings[level] * 1000:10.2f} ms  {timings['full'] / timings[level]:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
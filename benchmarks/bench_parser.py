@@ -0,0 +1,78 @@
+import argparse
+import struct
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.gif_factory import make_gif
+from gif_parser import GifParser
+
+
+def stream_scan(path: Path) -> int:
+    # Per-sub-block read()/seek() walk, the way GifParser scanned files before
+    # the memoryview engine; kept as the reference point for the speedup.
+    frames = 0
+    with path.open('rb') as f:
+        f.read(10)
+        packed = struct.unpack("<B", f.read(1))[0]
+        f.read(2)
+        if packed & 0b10000000:
+            f.seek(3 * (2 << (packed & 0b00000111)), 1)
+        while True:
+            block_type = f.read(1)
+            if not block_type or block_type == b'\x3B':
+                break
+            if block_type == b'\x2C':
+                packed = struct.unpack("<HHHHB", f.read(9))[4]
+                if packed & 0b10000000:
+                    f.seek(3 * (2 << (packed & 0b00000111)), 1)
+                f.read(1)
+                frames += 1
+            else:
+                f.read(1)
+            while True:
+                block_size = f.read(1)
+                if not block_size or block_size == b'\x00':
+                    break
+                f.seek(struct.unpack("<B", block_size)[0], 1)
+    return frames
+
+
+def best_of(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark GifParser.parse_file on synthetic GIFs')
+    parser.add_argument('--frames', type=int, default=500)
+    parser.add_argument('--size', type=int, nargs=2, default=(320, 240), metavar=('WIDTH', 'HEIGHT'))
+    parser.add_argument('--sub-block-size', type=int, default=255)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.gif"
+        path.write_bytes(make_gif(args.size[0], args.size[1], args.frames,
+                                 sub_block_size=args.sub_block_size))
+        size_mb = path.stat().st_size / (1024 * 1024)
+
+        assert stream_scan(path) == GifParser(path).parse_file()['frame_count'] == args.frames
+
+        stream_time = best_of(lambda: stream_scan(path), args.repeat)
+        parser_time = best_of(lambda: GifParser(path).parse_file(), args.repeat)
+        mmap_time = best_of(lambda: GifParser(path, use_mmap=True).parse_file(), args.repeat)
+
+    print(f"{args.frames} frames, {args.size[0]}x{args.size[1]}, {size_mb:.1f} MB")
+    print(f"stream scan:       {stream_time * 1000:8.1f} ms")
+    print(f"GifParser (mview): {parser_time * 1000:8.1f} ms")
+    print(f"GifParser (mmap):  {mmap_time * 1000:8.1f} ms")
+    print(f"speedup:           {stream_time / parser_time:8.1f}x (mview), {stream_time / mmap_time:.1f}x (mmap)")
+
+
+if __name__ == "__main__":
+    main()
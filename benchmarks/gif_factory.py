@@ -0,0 +1,110 @@
+import struct
+from typing import Optional
+
+
+def lzw_encode(indices: bytes, min_code_size: int) -> bytes:
+    clear_code = 1 << min_code_size
+    code_size = min_code_size + 1
+    run_length = clear_code - 2
+
+    out = bytearray()
+    acc = 0
+    bits = 0
+    codes = [clear_code]
+    for start in range(0, len(indices), run_length):
+        if start:
+            codes.append(clear_code)
+        codes.extend(indices[start:start + run_length])
+    codes.append(clear_code + 1)
+
+    for code in codes:
+        acc |= code << bits
+        bits += code_size
+        while bits >= 8:
+            out.append(acc & 0xFF)
+            acc >>= 8
+            bits -= 8
+    if bits:
+        out.append(acc & 0xFF)
+    return bytes(out)
+
+
+def sub_blocks(data: bytes, block_size: int = 255) -> bytes:
+    out = bytearray()
+    for start in range(0, len(data), block_size):
+        chunk = data[start:start + block_size]
+        out.append(len(chunk))
+        out += chunk
+    out.append(0)
+    return bytes(out)
+
+
+_INTERLACE_PASSES = ((0, 8), (4, 8), (2, 4), (1, 2))
+
+
+def interlace(pixels: bytes, width: int, height: int) -> bytes:
+    rows = [row for first, step in _INTERLACE_PASSES for row in range(first, height, step)]
+    return b"".join(pixels[row * width:(row + 1) * width] for row in rows)
+
+
+def palette(size: int, seed: int = 0) -> bytes:
+    return bytes((i * 7 + seed * 29) & 0xFF for i in range(3 * size))
+
+
+def comment_extension(text: str, sub_block_size: int = 255) -> bytes:
+    return b"\x21\xFE" + sub_blocks(text.encode('ascii'), sub_block_size)
+
+
+def application_extension(identifier: bytes, data: bytes) -> bytes:
+    return b"\x21\xFF\x0b" + identifier[:11].ljust(11, b" ") + sub_blocks(data)
+
+
+def image_frame(left: int, top: int, width: int, height: int, color: int, disposal: int = 1,
+                transparent: Optional[int] = None, colors: int = 1, min_code_size: int = 2) -> bytes:
+    flags = disposal << 2 | (1 if transparent is not None else 0)
+    pixels = bytes((color + x % colors) % (1 << min_code_size) for x in range(width * height))
+    return (
+        struct.pack("<BBBBHBB", 0x21, 0xF9, 4, flags, 10, transparent or 0, 0) +
+        struct.pack("<BHHHHB", 0x2C, left, top, width, height, 0) +
+        bytes([min_code_size]) + sub_blocks(lzw_encode(pixels, min_code_size))
+    )
+
+
+def make_gif(width: int, height: int, frame_count: int, palette_size: int = 256,
+             delay: int = 4, sub_block_size: int = 255, variants: int = 4,
+             local_palettes: bool = False, interlaced: bool = False,
+             comment: Optional[str] = None, app_extensions: int = 0) -> bytes:
+    depth = max(1, (palette_size - 1).bit_length())
+    min_code_size = max(2, depth)
+
+    out = bytearray(b"GIF89a")
+    if local_palettes:
+        out += struct.pack("<HHBBB", width, height, 0x70, 0, 0)
+    else:
+        out += struct.pack("<HHBBB", width, height, 0xF0 | (depth - 1), 0, 0)
+        out += palette(1 << depth)
+    out += b"\x21\xFF\x0bNETSCAPE2.0\x03\x01\x00\x00\x00"
+    for n in range(app_extensions):
+        out += application_extension(b"BENCHAPP1.0", bytes(range(n % 7, n % 7 + 40)))
+    if comment is not None:
+        out += comment_extension(comment, sub_block_size)
+
+    encoded = []
+    for variant in range(variants):
+        pixels = bytes((x + y + variant) % palette_size for y in range(height) for x in range(width))
+        if interlaced:
+            pixels = interlace(pixels, width, height)
+        encoded.append(bytes([min_code_size]) + sub_blocks(lzw_encode(pixels, min_code_size), sub_block_size))
+
+    flags = 0x40 if interlaced else 0
+    if local_palettes:
+        flags |= 0x80 | (depth - 1)
+    for frame in range(frame_count):
+        out += struct.pack("<BBBBHBB", 0x21, 0xF9, 4, 0b00000100, delay, 0, 0)
+        out += struct.pack("<BHHHHB", 0x2C, 0, 0, width, height, flags)
+        if local_palettes:
+            out += palette(1 << depth, seed=frame + 1)
+        out += encoded[frame % variants]
+
+    out += b"\x3B"
+    return bytes(out)
@@ -0,0 +1,213 @@
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.gif_factory import make_gif
+
+ROOT = Path(__file__).parent.parent
+
+CORPUS = {
+    'many_small': dict(width=32, height=32, frame_count=5000),
+    'large_frames': dict(width=640, height=480, frame_count=20),
+    'local_interlaced': dict(width=64, height=64, frame_count=500, local_palettes=True, interlaced=True,
+                             comment="synthetic benchmark corpus " * 20, app_extensions=4),
+    'small_sub_blocks': dict(width=128, height=128, frame_count=200, sub_block_size=16),
+}
+
+QUICK_CORPUS = {
+    'many_small': dict(width=16, height=16, frame_count=500),
+    'large_frames': dict(width=160, height=120, frame_count=5),
+    'local_interlaced': dict(width=32, height=32, frame_count=50, local_palettes=True, interlaced=True,
+                             comment="synthetic benchmark corpus", app_extensions=2),
+    'small_sub_blocks': dict(width=64, height=64, frame_count=20, sub_block_size=16),
+}
+
+
+def measure(func: Callable[[], object], repeat: int) -> Dict:
+    func()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return {'best_ms': round(min(timings), 4), 'median_ms': round(statistics.median(timings), 4), 'runs': repeat}
+
+
+def write_corpus(directory: Path, corpus: Dict[str, Dict]) -> Dict[str, Path]:
+    paths = {}
+    for name, params in corpus.items():
+        path = directory / f"{name}.gif"
+        path.write_bytes(make_gif(**params))
+        paths[name] = path
+    return paths
+
+
+def parser_cases(paths: Dict[str, Path]) -> Dict[str, Callable[[], object]]:
+    from gif_parser import GifParser
+
+    cases = {}
+    for name, path in paths.items():
+        cases[f"parse_file/{name}"] = lambda path=path: GifParser(path).parse_file()
+        cases[f"parse_file_mmap/{name}"] = lambda path=path: GifParser(path, use_mmap=True).parse_file()
+        cases[f"parse_file_summary/{name}"] = lambda path=path: GifParser(path).parse_file('summary')
+    return cases
+
+
+def skip_blocks_cases(paths: Dict[str, Path]) -> Dict[str, Callable[[], object]]:
+    from gif_parser import GifParser
+
+    cases = {}
+    for name in ('large_frames', 'small_sub_blocks'):
+        parser = GifParser(paths[name])
+        parser.parse_file()
+        buf = parser.buffer
+        offsets = [offset + 1 for offset in parser.frame_index.columns['data_offset']]
+
+        def skip_all(parser=parser, buf=buf, offsets=offsets):
+            for offset in offsets:
+                parser._skip_data_blocks(buf, offset)
+
+        cases[f"skip_data_blocks/{name}"] = skip_all
+    return cases
+
+
+def compositor_cases(paths: Dict[str, Path]) -> Dict[str, Callable[[], object]]:
+    from gif_compositor import FrameCompositor
+
+    cases = {}
+    for name in ('large_frames', 'local_interlaced'):
+        compositor = FrameCompositor.open(paths[name])
+        cases[f"composite_all_frames/{name}"] = lambda compositor=compositor: [None for _ in compositor]
+    return cases
+
+
+def parallel_cases(paths: Dict[str, Path]) -> Dict[str, Callable[[], object]]:
+    from gif_parallel import decode_frames
+
+    def decode(path: Path, workers: Optional[int]):
+        decode_frames(path, workers).close()
+
+    return {
+        'decode_frames_sequential/large_frames': lambda: decode(paths['large_frames'], 1),
+        'decode_frames_parallel/large_frames': lambda: decode(paths['large_frames'], None),
+    }
+
+
+def checkerboard_cases(paths: Dict[str, Path]) -> Dict[str, Callable[[], object]]:
+    try:
+        from PIL import Image
+        from gif_analyzer import draw_checkerboard
+    except ImportError as e:
+        print(f"Skipping checkerboard benchmarks: {str(e)}", file=sys.stderr)
+        return {}
+
+    from gif_compositor import FrameCompositor
+
+    compositor = FrameCompositor.open(paths['large_frames'])
+    frames = [Image.fromarray(canvas.copy(), "RGBA") for canvas in compositor]
+    return {
+        'checkerboard/large_frames': lambda: [draw_checkerboard(frame) for frame in frames],
+        'checkerboard_zoom4/large_frames': lambda: [draw_checkerboard(frame, zoom=4) for frame in frames[:2]],
+    }
+
+
+def cli_cases(paths: Dict[str, Path]) -> Dict[str, Callable[[], object]]:
+    def run(*args: str):
+        subprocess.run([sys.executable, '-m', 'cli', *args], cwd=ROOT, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    directory = str(paths['many_small'].parent)
+    return {
+        'cli_text/local_interlaced': lambda: run(str(paths['local_interlaced'])),
+        'cli_jsonl/many_small': lambda: run(str(paths['many_small']), '--format', 'jsonl'),
+        'cli_batch_jsonl/corpus': lambda: run('--batch', directory, '-j', '2', '--format', 'jsonl'),
+    }
+
+
+GROUPS = {
+    'parser': parser_cases,
+    'skip_data_blocks': skip_blocks_cases,
+    'compositor': compositor_cases,
+    'parallel': parallel_cases,
+    'checkerboard': checkerboard_cases,
+    'cli': cli_cases,
+}
+
+
+def git_revision() -> Optional[str]:
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                                capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def run_suite(groups: List[str], corpus: Dict[str, Dict], repeat: int, match: Optional[str] = None,
+              corpus_name: str = 'full') -> Dict:
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = write_corpus(Path(tmp), corpus)
+        for group in groups:
+            for name, func in GROUPS[group](paths).items():
+                if match and match not in name:
+                    continue
+                file_name = name.split('/', 1)[1]
+                results[name] = {'params': corpus.get(file_name, {}), **measure(func, repeat)}
+                print(f"{name:45}{results[name]['best_ms']:12.2f} ms", file=sys.stderr)
+
+    return {
+        'meta': {
+            'revision': git_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'corpus': corpus_name,
+            'repeat': repeat,
+        },
+        'results': results,
+    }
+
+
+def compare(baseline: Dict, current: Dict) -> List[str]:
+    lines = [f"{'benchmark':45}{'baseline':>12}{'current':>12}{'ratio':>8}"]
+    for name, result in current['results'].items():
+        previous = baseline['results'].get(name)
+        if previous is None:
+            continue
+        ratio = result['best_ms'] / previous['best_ms'] if previous['best_ms'] else float('inf')
+        lines.append(f"{name:45}{previous['best_ms']:12.2f}{result['best_ms']:12.2f}{ratio:8.2f}")
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the benchmark suite on a synthetic GIF corpus')
+    parser.add_argument('--group', choices=list(GROUPS), nargs='+', default=list(GROUPS))
+    parser.add_argument('--match', help='Only run benchmarks whose name contains this text')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--quick', action='store_true', help='Use a smaller corpus')
+    parser.add_argument('-o', '--output', type=Path, help='Write results as JSON to this file')
+    parser.add_argument('--compare', type=Path, metavar='BASELINE', help='Compare with a previous JSON result')
+    args = parser.parse_args()
+
+    report = run_suite(args.group, QUICK_CORPUS if args.quick else CORPUS, args.repeat, args.match,
+                       'quick' if args.quick else 'full')
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text, encoding='utf-8')
+    else:
+        print(text)
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding='utf-8'))
+        print("\n".join(compare(baseline, report)), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
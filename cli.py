@@ -1,33 +1,257 @@
 import argparse
+import glob
+import os
+import sys
 from pathlib import Path
-from gif_parser import GifParser
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from gif_parser import GifParser, ParseLimits
+from gif_records import (RECORD_FORMATS, JsonLinesWriter, MsgpackWriter, error_record, file_record, frame_records,
+                         iter_records)
+
+
+def format_info(info: Dict) -> str:
+    text = []
+    text.append("=== GIF Information ===")
+    for section, items in info['headers'].items():
+        text.append(f"\n{section}:")
+        for key, (value, description) in items.items():
+            text.append(f"{key}: {value} ({description})")
+
+    text.append("\n=== Frame Information ===")
+    for i, frame in enumerate(info['frames'], 1):
+        text.append(f"\nFrame {i}:")
+        for key, value in frame.items():
+            text.append(f"{key}: {value}")
+
+    return "\n".join(text)
+
+
+def format_heaviest_frames(gif_parser: GifParser, count: int) -> str:
+    frame_index = gif_parser.frame_index
+    total = sum(frame_index.columns['compressed_size']) or 1
+    text = ["=== Heaviest Frames ==="]
+    for n in frame_index.heaviest(count):
+        record = frame_index.record(n)
+        text.append(f"Frame {n + 1}: {gif_parser._format_size(record.compressed_size)} "
+                    f"({100 * record.compressed_size / total:.1f}% of image data), "
+                    f"{record.bytes_per_pixel:.3f} bytes/pixel, {record.width}x{record.height}, "
+                    f"{record.sub_block_count} sub-blocks, LZW code size {record.min_code_size}, "
+                    f"local palette {record.color_table_size}")
+    return "\n".join(text)
+
+
+def format_summary_line(result: Dict) -> str:
+    if 'error' in result:
+        return f"{result['path']}: Error: {result['error']}"
+
+    summary = result['info']['headers']['Summary']
+    return (f"{result['path']}: {summary['Resolution'][0]}, {summary['Frame Count'][0]} frames, "
+            f"{summary['Duration'][0]}, {summary['Frame Rate'][0]}")
+
+
+def iter_input_paths(inputs: Iterable[str], from_stdin: bool = False) -> Iterator[Path]:
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            yield from (p for p in path.rglob('*') if p.suffix.lower() == '.gif' and p.is_file())
+        elif any(char in item for char in '*?['):
+            yield from (Path(p) for p in glob.iglob(item, recursive=True) if os.path.isfile(p))
+        else:
+            yield path
+
+    if from_stdin:
+        for line in sys.stdin:
+            line = line.strip()
+            if line:
+                yield Path(line)
+
+
+def open_cache(cache_options: Optional[Tuple]):
+    if cache_options is None:
+        return None
+    from gif_analysis_cache import DEFAULT_CACHE_BYTES, AnalysisCache
+
+    db_path, max_bytes, use_hash = cache_options
+    return AnalysisCache(db_path, max_bytes or DEFAULT_CACHE_BYTES, use_hash)
+
+
+def analyze_path(path: Path, record_format: Optional[str] = None, cache=None,
+                 limits: Optional[ParseLimits] = None) -> Dict:
+    try:
+        gif_parser = GifParser(path, cache=cache, limits=limits)
+        info = gif_parser.parse_file()
+        result = {'path': str(path), 'cached': gif_parser.from_cache}
+        if record_format:
+            result['file'] = file_record(gif_parser, str(path))
+            result['frame_index'] = gif_parser.frame_index
+        else:
+            result['info'] = info
+        return result
+    except Exception as e:
+        return {'path': str(path), 'error': str(e)}
+
+
+def analyze_chunk(paths: List[Path], record_format: Optional[str] = None,
+                  cache_options: Optional[Tuple] = None, limits: Optional[ParseLimits] = None) -> List[Dict]:
+    cache = open_cache(cache_options)
+    try:
+        return [analyze_path(path, record_format, cache, limits) for path in paths]
+    finally:
+        if cache is not None:
+            cache.close()
+
+
+def iter_batch_results(paths: Iterable[Path], workers: int = 1, chunksize: int = 16,
+                       record_format: Optional[str] = None, cache_options: Optional[Tuple] = None,
+                       limits: Optional[ParseLimits] = None) -> Iterator[Dict]:
+    if workers <= 1:
+        cache = open_cache(cache_options)
+        try:
+            yield from (analyze_path(path, record_format, cache, limits) for path in paths)
+        finally:
+            if cache is not None:
+                cache.close()
+        return
+
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+    from itertools import islice
+
+    paths = iter(paths)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        while True:
+            chunk = list(islice(paths, chunksize))
+            if chunk:
+                pending.add(executor.submit(analyze_chunk, chunk, record_format, cache_options, limits))
+            if pending and (not chunk or len(pending) >= workers * 4):
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+            elif not chunk:
+                break
+
+
+def open_output(args):
+    if args.format == 'msgpack':
+        return args.output.open('wb') if args.output else sys.stdout.buffer
+    return args.output.open('w', encoding='utf-8') if args.output else sys.stdout
+
+
+def make_writer(record_format: str, out):
+    return MsgpackWriter(out) if record_format == 'msgpack' else JsonLinesWriter(out)
+
+
+def write_result(writer, result: Dict) -> None:
+    if 'error' in result:
+        writer.write(error_record(result['path'], result['error']))
+    else:
+        writer.write(result['file'])
+        for record in frame_records(result['frame_index']):
+            writer.write(record)
+    writer.flush()
+
+
+def cache_options(args) -> Optional[Tuple]:
+    if not args.cache:
+        return None
+    return args.cache, args.cache_size and args.cache_size * 1024 * 1024, args.cache_hash
+
+
+def parse_limits(args) -> Optional[ParseLimits]:
+    limits = ParseLimits(args.max_frames, args.max_canvas_pixels, args.max_bytes, args.max_frame_pixels,
+                         args.max_seconds)
+    return limits if any(value is not None for value in limits) else None
+
+
+def run_batch(args) -> None:
+    paths = iter_input_paths(args.batch or [], args.from_stdin)
+    record_format = args.format if args.format in RECORD_FORMATS else None
+    out = open_output(args)
+    writer = make_writer(record_format, out) if record_format else None
+
+    analyzed = errors = hits = 0
+    try:
+        for result in iter_batch_results(paths, args.workers, args.chunksize, record_format, cache_options(args),
+                                         parse_limits(args)):
+            analyzed += 1
+            errors += 'error' in result
+            hits += result.get('cached', False)
+            if writer:
+                write_result(writer, result)
+            else:
+                print(format_summary_line(result), file=out, flush=True)
+    finally:
+        if args.output:
+            out.close()
+
+    print(f"Analyzed {analyzed} files, {errors} errors", file=sys.stderr)
+    if args.cache:
+        print(f"Cache: {hits} hits, {analyzed - errors - hits} misses", file=sys.stderr)
+
+
+def write_records(args, gif_parser: GifParser) -> None:
+    out = open_output(args)
+    try:
+        writer = make_writer(args.format, out)
+        for record in iter_records(gif_parser, str(args.file)):
+            writer.write(record)
+        writer.flush()
+    finally:
+        if args.output:
+            out.close()
 
 
 def main():
     parser = argparse.ArgumentParser(description='Analyze GIF files and extract detailed information')
-    parser.add_argument('file', type=Path, help='Path to GIF file to analyze')
+    parser.add_argument('file', type=Path, nargs='?', help='Path to GIF file to analyze, or - to read it from stdin')
     parser.add_argument('-o', '--output', type=Path, help='Save result to specified file')
+    parser.add_argument('--mmap', action='store_true', help='Memory-map the file instead of reading it into memory')
+    parser.add_argument('--index-sidecar', action='store_true', help='Save the frame offset index next to the file')
+    parser.add_argument('--batch', nargs='+', metavar='PATH',
+                        help='Analyze files, directories or glob patterns in parallel, one line per file')
+    parser.add_argument('--from-stdin', action='store_true', help='Read paths to analyze from stdin (batch mode)')
+    parser.add_argument('-j', '--workers', type=int, default=os.cpu_count() or 1,
+                        help='Number of worker processes in batch mode')
+    parser.add_argument('--chunksize', type=int, default=16, help='Files per worker task in batch mode')
+    parser.add_argument('--cache', type=Path, metavar='DB', help='Reuse analysis results stored in this SQLite file')
+    parser.add_argument('--cache-size', type=int, metavar='MB',
+                        help='Maximum size of the analysis cache before least recently used entries are evicted '
+                             '(default: 64)')
+    parser.add_argument('--cache-hash', action='store_true',
+                        help='Also compare content hashes so touched but unchanged files stay cached')
+    parser.add_argument('--heaviest', type=int, default=5, metavar='N',
+                        help='List the N frames with the most compressed image data (text output, 0 to disable)')
+    parser.add_argument('--max-frames', type=int, metavar='N', help='Stop with an error after N frames')
+    parser.add_argument('--max-canvas-pixels', type=int, metavar='N', help='Reject canvases larger than N pixels')
+    parser.add_argument('--max-bytes', type=int, metavar='N', help='Stop with an error after scanning N bytes')
+    parser.add_argument('--max-frame-pixels', type=int, metavar='N', help='Reject frames larger than N pixels')
+    parser.add_argument('--max-seconds', type=float, metavar='S', help='Stop with an error after S seconds per file')
+    parser.add_argument('--format', choices=('text',) + RECORD_FORMATS, default='text',
+                        help='Output format: human-readable text, JSON Lines or MessagePack records')
 
     args = parser.parse_args()
 
+    if args.batch or args.from_stdin:
+        run_batch(args)
+        return
+    if args.file is None:
+        parser.error('a file, --batch or --from-stdin is required')
+
+    cache = None
     try:
-        gif_parser = GifParser(args.file)
+        cache = open_cache(cache_options(args))
+        source = sys.stdin.buffer if str(args.file) == '-' else args.file
+        gif_parser = GifParser(source, use_mmap=args.mmap, index_sidecar=args.index_sidecar, cache=cache,
+                               limits=parse_limits(args))
         info = gif_parser.parse_file()
 
-        text = []
-        text.append("=== GIF Information ===")
-        for section, items in info['headers'].items():
-            text.append(f"\n{section}:")
-            for key, (value, description) in items.items():
-                text.append(f"{key}: {value} ({description})")
-
-        text.append("\n=== Frame Information ===")
-        for i, frame in enumerate(info['frames'], 1):
-            text.append(f"\nFrame {i}:")
-            for key, value in frame.items():
-                text.append(f"{key}: {value}")
+        if args.format in RECORD_FORMATS:
+            write_records(args, gif_parser)
+            return
 
-        result = "\n".join(text)
+        result = format_info(info)
+        if args.heaviest > 0 and len(gif_parser.frame_index):
+            result += "\n\n" + format_heaviest_frames(gif_parser, args.heaviest)
 
         if args.output:
             args.output.write_text(result, encoding='utf-8')
@@ -38,6 +262,9 @@ def main():
     except Exception as e:
         print(f"Error: {str(e)}")
         exit(1)
+    finally:
+        if cache is not None:
+            cache.close()
 
 
 if __name__ == "__main__":
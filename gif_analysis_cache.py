@@ -0,0 +1,149 @@
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from gif_index import FrameIndex
+
+
+DEFAULT_CACHE_BYTES = 64 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS analysis (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    digest TEXT,
+    state BLOB NOT NULL,
+    frame_index BLOB NOT NULL,
+    nbytes INTEGER NOT NULL,
+    accessed INTEGER NOT NULL
+)
+"""
+
+
+def _tuples(value):
+    if isinstance(value, list):
+        return tuple(_tuples(item) for item in value)
+    if isinstance(value, dict):
+        return {key: _tuples(item) for key, item in value.items()}
+    return value
+
+
+def file_digest(file_path: Path) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    with file_path.open('rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class AnalysisCache:
+    def __init__(self, db_path: Path, max_bytes: int = DEFAULT_CACHE_BYTES, use_hash: bool = False):
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.use_hash = use_hash
+        self.hits = 0
+        self.misses = 0
+        self._touched = {}
+        self._conn = sqlite3.connect(str(db_path), timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    def __enter__(self) -> 'AnalysisCache':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.flush()
+        self._conn.close()
+
+    def flush(self) -> None:
+        self._write_access_times()
+        self._conn.commit()
+
+    @staticmethod
+    def _key(file_path: Path) -> str:
+        return str(file_path.resolve())
+
+    @staticmethod
+    def _stamp(file_path: Path) -> Tuple[int, int]:
+        stat = file_path.stat()
+        return stat.st_size, stat.st_mtime_ns
+
+    def get(self, file_path: Path) -> Optional[Tuple[Dict, FrameIndex]]:
+        key = self._key(file_path)
+        row = self._conn.execute(
+            "SELECT size, mtime_ns, digest, state, frame_index FROM analysis WHERE path = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+
+        size, mtime_ns, digest, state, frame_index = row
+        stamp = self._stamp(file_path)
+        if stamp != (size, mtime_ns):
+            if not (self.use_hash and digest and stamp[0] == size and file_digest(file_path) == digest):
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE analysis SET mtime_ns = ? WHERE path = ?", (stamp[1], key))
+            self._conn.commit()
+
+        index = FrameIndex.from_bytes(frame_index)
+        try:
+            state = _tuples(json.loads(state))
+        except ValueError:
+            index = None
+        if index is None:
+            self.misses += 1
+            return None
+
+        self._touched[key] = time.time_ns()
+        self.hits += 1
+        return state, index
+
+    def put(self, file_path: Path, state: Dict, frame_index: FrameIndex) -> None:
+        stamp = self._stamp(file_path)
+        digest = file_digest(file_path) if self.use_hash else None
+        state_blob = json.dumps(state, separators=(',', ':')).encode()
+        index_blob = frame_index.to_bytes(stamp)
+        nbytes = len(state_blob) + len(index_blob)
+        if nbytes > self.max_bytes:
+            return
+
+        self._conn.execute(
+            "INSERT OR REPLACE INTO analysis VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (self._key(file_path), stamp[0], stamp[1], digest, state_blob, index_blob, nbytes, time.time_ns()))
+        self._evict()
+        self.flush()
+
+    def _write_access_times(self) -> None:
+        if self._touched:
+            self._conn.executemany("UPDATE analysis SET accessed = ? WHERE path = ?",
+                                   [(accessed, key) for key, accessed in self._touched.items()])
+            self._touched.clear()
+
+    def _evict(self) -> None:
+        self._write_access_times()
+        total = self.total_bytes()
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute("SELECT path, nbytes FROM analysis ORDER BY accessed").fetchall()
+        stale = []
+        for path, nbytes in rows:
+            if total <= self.max_bytes:
+                break
+            stale.append((path,))
+            total -= nbytes
+        self._conn.executemany("DELETE FROM analysis WHERE path = ?", stale)
+
+    def total_bytes(self) -> int:
+        return self._conn.execute("SELECT COALESCE(SUM(nbytes), 0) FROM analysis").fetchone()[0]
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM analysis").fetchone()[0]
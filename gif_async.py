@@ -0,0 +1,58 @@
+import asyncio
+from typing import AsyncIterator, Iterable, List, Optional, Union
+
+from gif_stream import GifStreamParser
+
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+DEFAULT_CONCURRENCY = 32
+
+
+async def iter_chunks(source, chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    if hasattr(source, 'read'):
+        while True:
+            chunk = await source.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    else:
+        async for chunk in source:
+            yield chunk
+
+
+async def iter_events(source, parser: Optional[GifStreamParser] = None,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[tuple]:
+    parser = GifStreamParser() if parser is None else parser
+    chunks = iter_chunks(source, chunk_size)
+    try:
+        async for chunk in chunks:
+            for event in parser.feed(chunk):
+                yield event
+            if parser.finished:
+                return
+    finally:
+        await chunks.aclose()
+    parser.close()
+
+
+async def analyze_stream(source, chunk_size: int = DEFAULT_CHUNK_SIZE) -> GifStreamParser:
+    parser = GifStreamParser()
+    async for _ in iter_events(source, parser, chunk_size):
+        pass
+    return parser
+
+
+async def analyze_many(sources: Iterable, concurrency: int = DEFAULT_CONCURRENCY,
+                       chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[Union[GifStreamParser, Exception]]:
+    pending = iter(enumerate(sources))
+    results = {}
+
+    async def worker():
+        for n, source in pending:
+            try:
+                results[n] = await analyze_stream(source, chunk_size)
+            except Exception as e:
+                results[n] = e
+
+    await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+    return [results[n] for n in range(len(results))]
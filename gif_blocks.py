@@ -0,0 +1,204 @@
+import struct
+import time
+from typing import Iterator, NamedTuple, Optional, Tuple, Union
+
+
+LOGICAL_SCREEN_DESCRIPTOR = struct.Struct("<HHBBB")
+IMAGE_DESCRIPTOR = struct.Struct("<HHHHB")
+GRAPHICS_CONTROL_EXTENSION = struct.Struct("<BBHB")
+NO_CONTROL = (-1, 0, 0, 0)
+
+EXTENSION_INTRODUCER = 0x21
+IMAGE_SEPARATOR = 0x2C
+TRAILER = 0x3B
+
+PLAIN_TEXT_LABEL = 0x01
+GRAPHICS_CONTROL_LABEL = 0xF9
+COMMENT_LABEL = 0xFE
+APPLICATION_LABEL = 0xFF
+
+DEADLINE_CHECK_INTERVAL = 4096
+
+
+class HeaderBlock(NamedTuple):
+    offset: int
+    length: int
+    signature: str
+    version: str
+
+
+class ScreenDescriptorBlock(NamedTuple):
+    offset: int
+    length: int
+    width: int
+    height: int
+    flags: int
+    background_color: int
+    aspect_ratio: int
+    color_table_offset: int
+
+    @property
+    def color_table_size(self) -> int:
+        return 2 << (self.flags & 0b00000111) if self.color_table_offset >= 0 else 0
+
+
+class GraphicsControlBlock(NamedTuple):
+    offset: int
+    length: int
+    flags: int
+    delay: int
+    transparent_index: int
+
+
+class ImageBlock(NamedTuple):
+    offset: int
+    length: int
+    left: int
+    top: int
+    width: int
+    height: int
+    flags: int
+    color_table_offset: int
+    data_offset: int
+    min_code_size: int
+    compressed_size: int
+    sub_block_count: int
+
+
+class ExtensionBlock(NamedTuple):
+    offset: int
+    length: int
+    label: int
+    identifier: bytes
+    data_offset: int
+
+
+class TrailerBlock(NamedTuple):
+    offset: int
+    length: int
+
+
+Block = Union[HeaderBlock, ScreenDescriptorBlock, GraphicsControlBlock, ImageBlock, ExtensionBlock, TrailerBlock]
+
+
+def scan_sub_blocks(buf, pos: int, deadline: Optional[float] = None) -> Tuple[int, int, int]:
+    start = pos
+    count = 0
+    try:
+        block_size = buf[pos]
+        while block_size:
+            count += 1
+            pos += block_size + 1
+            block_size = buf[pos]
+            if deadline is not None and not count % DEADLINE_CHECK_INTERVAL and time.perf_counter() > deadline:
+                raise TimeoutError(f"Scan deadline passed at offset {pos}")
+    except IndexError:
+        end = len(buf)
+        return end, end - start - count, count
+    return pos + 1, pos - start - count, count
+
+
+def skip_sub_blocks(buf, pos: int, deadline: Optional[float] = None) -> int:
+    if deadline is not None:
+        return scan_sub_blocks(buf, pos, deadline)[0]
+    try:
+        block_size = buf[pos]
+        while block_size:
+            pos += block_size + 1
+            block_size = buf[pos]
+    except IndexError:
+        return len(buf)
+    return pos + 1
+
+
+def read_header(buf, pos: int = 0) -> HeaderBlock:
+    header = bytes(buf[pos:pos + 6])
+    return HeaderBlock(pos, 6, header[:3].decode('ascii'), header[3:6].decode('ascii'))
+
+
+def read_screen_descriptor(buf, pos: int = 6) -> ScreenDescriptorBlock:
+    width, height, flags, background_color, aspect_ratio = LOGICAL_SCREEN_DESCRIPTOR.unpack_from(buf, pos)
+    length = LOGICAL_SCREEN_DESCRIPTOR.size
+    color_table_offset = -1
+    if flags & 0b10000000:
+        color_table_offset = pos + length
+        length += 3 * (2 << (flags & 0b00000111))
+    return ScreenDescriptorBlock(pos, length, width, height, flags, background_color, aspect_ratio,
+                                 color_table_offset)
+
+
+def iter_frame_blocks(buf, pos: int, deadline: Optional[float] = None) -> Iterator[Block]:
+    end = len(buf)
+    unpack_descriptor = IMAGE_DESCRIPTOR.unpack_from
+    unpack_control = GRAPHICS_CONTROL_EXTENSION.unpack_from
+    make_image = ImageBlock._make
+    make_control = GraphicsControlBlock._make
+    skipped = 0
+
+    while pos < end:
+        offset = pos
+        block_type = buf[pos]
+        pos += 1
+
+        if block_type == IMAGE_SEPARATOR:
+            left, top, width, height, flags = unpack_descriptor(buf, pos)
+            pos += IMAGE_DESCRIPTOR.size
+            color_table_offset = -1
+            if flags & 0b10000000:
+                color_table_offset = pos
+                pos += 3 * (2 << (flags & 0b00000111))
+            data_offset = pos
+            min_code_size = buf[pos] if pos < end else 0
+            if deadline is not None:
+                pos, compressed_size, sub_block_count = scan_sub_blocks(buf, pos + 1, deadline)
+            else:
+                start = pos = pos + 1
+                sub_block_count = 0
+                try:
+                    block_size = buf[pos]
+                    while block_size:
+                        sub_block_count += 1
+                        pos += block_size + 1
+                        block_size = buf[pos]
+                    pos += 1
+                    compressed_size = pos - start - sub_block_count - 1
+                except IndexError:
+                    pos = end
+                    compressed_size = pos - start - sub_block_count
+            yield make_image((offset, pos - offset, left, top, width, height, flags, color_table_offset, data_offset,
+                              min_code_size, compressed_size, sub_block_count))
+
+        elif block_type == EXTENSION_INTRODUCER:
+            label = buf[pos]
+            pos += 1
+            if label == GRAPHICS_CONTROL_LABEL:
+                block_size, flags, delay, transparent_index = unpack_control(buf, pos)
+                pos = skip_sub_blocks(buf, pos + 1 + block_size, deadline)
+                yield make_control((offset, pos - offset, flags, delay, transparent_index))
+                continue
+
+            identifier = b''
+            data_offset = pos
+            if label == APPLICATION_LABEL:
+                block_size = buf[pos]
+                identifier = bytes(buf[pos + 1:pos + 1 + block_size])
+                data_offset = pos + 1 + block_size
+            pos = skip_sub_blocks(buf, data_offset, deadline)
+            yield ExtensionBlock(offset, pos - offset, label, identifier, data_offset)
+
+        elif block_type == TRAILER:
+            yield TrailerBlock(offset, 1)
+            return
+
+        elif deadline is not None:
+            skipped += 1
+            if not skipped % DEADLINE_CHECK_INTERVAL and time.perf_counter() > deadline:
+                raise TimeoutError(f"Scan deadline passed at offset {pos}")
+
+
+def iter_blocks(buf) -> Iterator[Block]:
+    header = read_header(buf)
+    yield header
+    descriptor = read_screen_descriptor(buf, header.length)
+    yield descriptor
+    yield from iter_frame_blocks(buf, descriptor.offset + descriptor.length)
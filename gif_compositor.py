@@ -0,0 +1,149 @@
+from pathlib import Path
+from typing import Iterator, NamedTuple, Optional
+
+import numpy as np
+
+from gif_index import FrameRecord
+from gif_lzw import default_decoder
+from gif_parser import GifParser
+
+
+DISPOSE_TO_BACKGROUND = 2
+DISPOSE_TO_PREVIOUS = 3
+
+
+class CompositorState(NamedTuple):
+    position: int
+    canvas: np.ndarray
+    pending_disposal: Optional[tuple]
+    saved: Optional[np.ndarray]
+
+
+class FrameCompositor:
+    def __init__(self, buf, parser: GifParser):
+        self.buf = buf
+        self.parser = parser
+        self.width = parser.width
+        self.height = parser.height
+        self.frame_index = parser.frame_index
+
+        self.canvas = np.zeros((self.height, self.width, 4), dtype=np.uint8)
+        self._saved = np.zeros_like(self.canvas)
+        self._decoder = default_decoder()
+
+        widths = self.frame_index.columns['width']
+        heights = self.frame_index.columns['height']
+        self._indices = np.empty(max((w * h for w, h in zip(widths, heights)), default=0), dtype=np.uint8)
+
+        global_table = parser.color_table()
+        self._global_lut = None if global_table is None else self._build_lut(global_table)
+
+        self.position = -1
+        self._pending_disposal = None
+
+    @classmethod
+    def open(cls, file_path: Path) -> 'FrameCompositor':
+        parser = GifParser(file_path)
+        parser.parse_file()
+        return cls(parser.buffer if parser.buffer is not None else file_path.read_bytes(), parser)
+
+    def __len__(self) -> int:
+        return len(self.frame_index)
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        self.reset()
+        for _ in range(len(self)):
+            yield self.advance()
+
+    def reset(self, position: int = -1) -> None:
+        self.canvas.fill(0)
+        self.position = position
+        self._pending_disposal = None
+
+    def snapshot(self) -> CompositorState:
+        saved = None
+        if self._pending_disposal is not None and self._pending_disposal[0] == DISPOSE_TO_PREVIOUS:
+            _, rows, cols = self._pending_disposal
+            saved = self._saved[rows, cols].copy()
+        return CompositorState(self.position, self.canvas.copy(), self._pending_disposal, saved)
+
+    def restore(self, state: CompositorState) -> None:
+        self.position = state.position
+        self.canvas[...] = state.canvas
+        self._pending_disposal = state.pending_disposal
+        if state.saved is not None:
+            _, rows, cols = state.pending_disposal
+            self._saved[rows, cols] = state.saved
+
+    def render(self, n: int) -> np.ndarray:
+        if not 0 <= n < len(self):
+            raise IndexError(f"Frame {n} out of range")
+        if n < self.position:
+            self.reset()
+        while self.position < n:
+            self.advance()
+        return self.canvas
+
+    def advance(self) -> np.ndarray:
+        self._dispose_previous()
+        self.position += 1
+        record = self.frame_index.record(self.position)
+
+        region = self._clip(record)
+        if region is None:
+            return self.canvas
+        rows, cols = region
+
+        if record.disposal_method == DISPOSE_TO_PREVIOUS:
+            self._saved[rows, cols] = self.canvas[rows, cols]
+        self._pending_disposal = (record.disposal_method, rows, cols)
+
+        indices = self._decode(record)[:rows.stop - rows.start, :cols.stop - cols.start]
+        lut = self._lut_for(self.position)
+        pixels = lut[indices]
+        target = self.canvas[rows, cols]
+        if record.transparency:
+            np.copyto(target, pixels, where=(indices != record.transparent_index)[..., None])
+        else:
+            target[...] = pixels
+        return self.canvas
+
+    def _dispose_previous(self) -> None:
+        if self._pending_disposal is None:
+            return
+        method, rows, cols = self._pending_disposal
+        if method == DISPOSE_TO_BACKGROUND:
+            self.canvas[rows, cols] = 0
+        elif method == DISPOSE_TO_PREVIOUS:
+            self.canvas[rows, cols] = self._saved[rows, cols]
+        self._pending_disposal = None
+
+    def _clip(self, record: FrameRecord) -> Optional[tuple]:
+        right = min(record.left + record.width, self.width)
+        bottom = min(record.top + record.height, self.height)
+        if record.left >= right or record.top >= bottom:
+            return None
+        return slice(record.top, bottom), slice(record.left, right)
+
+    def _decode(self, record: FrameRecord) -> np.ndarray:
+        indices = self._indices[:record.width * record.height]
+        indices.fill(record.transparent_index if record.transparency else 0)
+        self._decoder.decode_frame(self.buf, record, indices)
+        return indices.reshape(record.height, record.width)
+
+    def _lut_for(self, n: int) -> np.ndarray:
+        local_table = self.parser.local_color_table(n)
+        if local_table is not None:
+            lut = self._build_lut(local_table)
+        elif self._global_lut is not None:
+            lut = self._global_lut
+        else:
+            lut = np.zeros((256, 4), dtype=np.uint8)
+        return lut
+
+    @staticmethod
+    def _build_lut(table: memoryview) -> np.ndarray:
+        lut = np.zeros((256, 4), dtype=np.uint8)
+        lut[:len(table), :3] = table
+        lut[:, 3] = 255
+        return lut
@@ -0,0 +1,91 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+from gif_compositor import FrameCompositor
+
+
+DEFAULT_BUDGET_BYTES = 256 * 1024 * 1024
+
+
+class FrameCache:
+    def __init__(self, compositor: FrameCompositor, budget_bytes: int = DEFAULT_BUDGET_BYTES,
+                 render: Optional[Callable[[np.ndarray], Any]] = None,
+                 keyframe_interval: Optional[int] = None):
+        self.compositor = compositor
+        self.budget_bytes = budget_bytes
+        self.render = render or np.copy
+        self.frame_bytes = max(compositor.canvas.nbytes, 1)
+
+        keyframe_budget = budget_bytes // 4
+        if keyframe_interval is None:
+            keyframe_interval = max(8, -(-len(compositor) * self.frame_bytes // max(keyframe_budget, 1)))
+        self.keyframe_interval = keyframe_interval
+        self.capacity = max(1, (budget_bytes - keyframe_budget) // self.frame_bytes)
+
+        self._frames = OrderedDict()
+        self._keyframes = {}
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.compositor)
+
+    def __getitem__(self, n: int) -> Any:
+        if n < 0:
+            n += len(self)
+        if not 0 <= n < len(self):
+            raise IndexError(f"Frame {n} out of range")
+
+        with self._lock:
+            item = self._frames.get(n)
+            if item is not None:
+                self._frames.move_to_end(n)
+                self.hits += 1
+                return item
+
+            self.misses += 1
+            item = self.render(self._composite(n))
+            self._frames[n] = item
+            while len(self._frames) > self.capacity:
+                self._frames.popitem(last=False)
+            return item
+
+    def warm(self, n: int, canvas: Optional[np.ndarray] = None) -> None:
+        with self._lock:
+            if n in self._frames:
+                return
+            if canvas is None:
+                canvas = self._composite(n)
+            if len(self._frames) < self.capacity:
+                self._frames[n] = self.render(canvas)
+
+    def __contains__(self, n: int) -> bool:
+        return n in self._frames
+
+    def clear(self) -> None:
+        with self._lock:
+            self._frames.clear()
+
+    def _composite(self, n: int) -> np.ndarray:
+        compositor = self.compositor
+        interval = self.keyframe_interval
+
+        key = n - n % interval
+        while key > 0 and key not in self._keyframes:
+            key -= interval
+
+        if not key <= compositor.position <= n:
+            if key in self._keyframes:
+                compositor.restore(self._keyframes[key])
+            else:
+                compositor.reset()
+
+        while compositor.position < n:
+            compositor.advance()
+            if compositor.position % interval == 0 and compositor.position not in self._keyframes:
+                self._keyframes[compositor.position] = compositor.snapshot()
+        return compositor.canvas
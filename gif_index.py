@@ -0,0 +1,196 @@
+import heapq
+import struct
+import sys
+from array import array
+from pathlib import Path
+from collections.abc import Sequence
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+
+_SIDECAR_MAGIC = b'GIFIDX02'
+_SIDECAR_HEADER = struct.Struct("<8sQqI")
+
+DISPOSAL_METHODS = [
+    "No disposal specified",
+    "Do not dispose",
+    "Restore to background",
+    "Restore to previous"
+]
+
+
+class FrameRecord(NamedTuple):
+    gce_offset: int
+    descriptor_offset: int
+    color_table_offset: int
+    data_offset: int
+    data_end: int
+    left: int
+    top: int
+    width: int
+    height: int
+    descriptor_flags: int
+    control_flags: int
+    delay: int
+    transparent_index: int
+    compressed_size: int
+    sub_block_count: int
+    min_code_size: int
+
+    @property
+    def interlaced(self) -> bool:
+        return bool(self.descriptor_flags & 0b01000000)
+
+    @property
+    def color_table_size(self) -> int:
+        return 2 << (self.descriptor_flags & 0b00000111) if self.color_table_offset >= 0 else 0
+
+    @property
+    def disposal_method(self) -> int:
+        return (self.control_flags & 0b00011100) >> 2
+
+    @property
+    def transparency(self) -> bool:
+        return self.gce_offset >= 0 and bool(self.control_flags & 0b00000001)
+
+    @property
+    def delay_ms(self) -> int:
+        return self.delay * 10
+
+    @property
+    def bytes_per_pixel(self) -> float:
+        pixels = self.width * self.height
+        return self.compressed_size / pixels if pixels else 0.0
+
+
+def frame_info(record: FrameRecord) -> Dict:
+    packed = record.descriptor_flags
+    info = {
+        'Position': (record.left, record.top),
+        'Size': f"{record.width}x{record.height}",
+        'Local Color Table': bool(packed & 0b10000000),
+        'Interlaced': record.interlaced,
+        'Sort Flag': bool(packed & 0b00100000),
+        'Color Table Size': 2 << (packed & 0b00000111)
+    }
+    if record.gce_offset >= 0:
+        disposal_method = record.disposal_method
+        info.update({
+            'Delay': f"{record.delay_ms}ms",
+            'Disposal Method': DISPOSAL_METHODS[disposal_method] if disposal_method < len(
+                DISPOSAL_METHODS) else f"Unknown ({disposal_method})",
+            'User Input': bool(record.control_flags & 0b00000010),
+            'Transparency': record.transparency,
+            'Transparent Color': record.transparent_index if record.transparency else None
+        })
+    return info
+
+
+class FrameIndex:
+    COLUMNS = (
+        ('gce_offset', 'q'),
+        ('descriptor_offset', 'q'),
+        ('color_table_offset', 'q'),
+        ('data_offset', 'q'),
+        ('data_end', 'q'),
+        ('left', 'H'),
+        ('top', 'H'),
+        ('width', 'H'),
+        ('height', 'H'),
+        ('descriptor_flags', 'B'),
+        ('control_flags', 'B'),
+        ('delay', 'H'),
+        ('transparent_index', 'B'),
+        ('compressed_size', 'q'),
+        ('sub_block_count', 'I'),
+        ('min_code_size', 'B'),
+    )
+
+    def __init__(self):
+        self.columns = {name: array(typecode) for name, typecode in self.COLUMNS}
+        self._appenders = [self.columns[name].append for name, _ in self.COLUMNS]
+
+    def __len__(self) -> int:
+        return len(self.columns['descriptor_offset'])
+
+    def append(self, *values: int) -> None:
+        if len(values) != len(self._appenders):
+            raise TypeError(f"FrameIndex.append expects {len(self._appenders)} values, got {len(values)}")
+        for append, value in zip(self._appenders, values):
+            append(value)
+
+    def delays_ms(self) -> List[int]:
+        return [delay * 10 for delay in self.columns['delay']]
+
+    def heaviest(self, count: int) -> List[int]:
+        return heapq.nlargest(count, range(len(self)), key=self.columns['compressed_size'].__getitem__)
+
+    def record(self, n: int) -> FrameRecord:
+        return FrameRecord(*(self.columns[name][n] for name, _ in self.COLUMNS))
+
+    def to_bytes(self, stamp: Tuple[int, int]) -> bytes:
+        file_size, mtime_ns = stamp
+        chunks = [_SIDECAR_HEADER.pack(_SIDECAR_MAGIC, file_size, mtime_ns, len(self))]
+        for name, typecode in self.COLUMNS:
+            column = self.columns[name]
+            if sys.byteorder == 'big':
+                column = array(typecode, column)
+                column.byteswap()
+            chunks.append(column.tobytes())
+        return b''.join(chunks)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, stamp: Optional[Tuple[int, int]] = None) -> Optional['FrameIndex']:
+        if len(data) < _SIDECAR_HEADER.size:
+            return None
+        magic, file_size, mtime_ns, count = _SIDECAR_HEADER.unpack_from(data)
+        if magic != _SIDECAR_MAGIC or (stamp is not None and (file_size, mtime_ns) != stamp):
+            return None
+
+        index = cls()
+        pos = _SIDECAR_HEADER.size
+        for name, typecode in cls.COLUMNS:
+            column = index.columns[name]
+            end = pos + count * column.itemsize
+            if end > len(data):
+                return None
+            column.frombytes(data[pos:end])
+            if sys.byteorder == 'big':
+                column.byteswap()
+            pos = end
+        return index
+
+    def save(self, path: Path, stamp: Tuple[int, int]) -> None:
+        path.write_bytes(self.to_bytes(stamp))
+
+    @classmethod
+    def load(cls, path: Path, stamp: Tuple[int, int]) -> Optional['FrameIndex']:
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        return cls.from_bytes(data, stamp)
+
+
+class FrameInfoView(Sequence):
+    def __init__(self, frame_index: FrameIndex):
+        self.frame_index = frame_index
+
+    def __len__(self) -> int:
+        return len(self.frame_index)
+
+    def __getitem__(self, n):
+        if isinstance(n, slice):
+            return [self[i] for i in range(*n.indices(len(self)))]
+        if n < 0:
+            n += len(self)
+        if not 0 <= n < len(self):
+            raise IndexError(f"Frame {n} out of range")
+        return frame_info(self.frame_index.record(n))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (FrameInfoView, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"FrameInfoView({len(self)} frames)"
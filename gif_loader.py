@@ -0,0 +1,83 @@
+import queue
+import threading
+from concurrent.futures import CancelledError
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+from gif_compositor import FrameCompositor
+from gif_frame_cache import DEFAULT_BUDGET_BYTES, FrameCache
+from gif_parser import GifParser
+
+
+PARALLEL_MIN_FRAMES = 256
+
+
+class GifLoader(threading.Thread):
+    def __init__(self, file_path: Path, budget_bytes: Optional[int] = None,
+                 render: Optional[Callable[[np.ndarray], Any]] = None, workers: int = 1):
+        super().__init__(daemon=True)
+        self.file_path = Path(file_path)
+        self.budget_bytes = DEFAULT_BUDGET_BYTES if budget_bytes is None else budget_bytes
+        self.workers = workers
+        self.render = render
+        self.events = queue.Queue()
+        self._cancelled = threading.Event()
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def run(self) -> None:
+        try:
+            parser = GifParser(self.file_path)
+            info = parser.parse_file()
+            if self.cancelled:
+                return
+
+            buf = parser.buffer if parser.buffer is not None else self.file_path.read_bytes()
+            compositor = FrameCompositor(buf, parser)
+            frames = FrameCache(compositor, self.budget_bytes, render=self.render)
+            self.events.put(('parsed', info, frames))
+
+            if self.workers > 1 and PARALLEL_MIN_FRAMES <= len(frames) <= frames.capacity:
+                self._load_parallel(parser, frames)
+            else:
+                for n in range(len(frames)):
+                    if self.cancelled:
+                        return
+                    frames.warm(n)
+                    self.events.put(('progress', n + 1))
+
+            if not self.cancelled:
+                self.events.put(('done',))
+        except Exception as e:
+            self.events.put(('error', str(e)))
+
+    def _load_parallel(self, parser: GifParser, frames: FrameCache) -> None:
+        from gif_parallel import decode_frames
+
+        frames.warm(0)
+        self.events.put(('progress', 1))
+        try:
+            decoded = decode_frames(self.file_path, self.workers, parser=parser, cancelled=lambda: self.cancelled)
+        except CancelledError:
+            return
+        with decoded:
+            for n in range(1, len(frames)):
+                if self.cancelled:
+                    return
+                frames.warm(n, decoded[n])
+                self.events.put(('progress', n + 1))
+
+    def drain(self) -> list:
+        events = []
+        while True:
+            try:
+                events.append(self.events.get_nowait())
+            except queue.Empty:
+                return events
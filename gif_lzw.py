@@ -0,0 +1,181 @@
+import io
+from typing import Iterable, List, Optional
+
+from gif_blocks import IMAGE_DESCRIPTOR, IMAGE_SEPARATOR, LOGICAL_SCREEN_DESCRIPTOR, TRAILER
+from gif_index import FrameRecord
+
+
+MAX_CODES = 4096
+_INTERLACE_PASSES = ((0, 8), (4, 8), (2, 4), (1, 2))
+
+
+def interlaced_rows(height: int) -> List[int]:
+    return [row for first, step in _INTERLACE_PASSES for row in range(first, height, step)]
+
+
+def single_frame_gif(buf, record: FrameRecord) -> bytes:
+    return b''.join((
+        b'GIF89a',
+        LOGICAL_SCREEN_DESCRIPTOR.pack(record.width, record.height, 0, 0, 0),
+        bytes([IMAGE_SEPARATOR]),
+        IMAGE_DESCRIPTOR.pack(0, 0, record.width, record.height, record.descriptor_flags & 0b01000000),
+        bytes(buf[record.data_offset:record.data_end]),
+        bytes([TRAILER]),
+    ))
+
+
+def read_image_data(buf, record: FrameRecord) -> bytes:
+    pos = record.data_offset + 1
+    end = min(record.data_end, len(buf))
+    chunks = []
+    while pos < end:
+        block_size = buf[pos]
+        if block_size == 0:
+            break
+        chunks.append(buf[pos + 1:pos + 1 + block_size])
+        pos += block_size + 1
+    return b''.join(chunks)
+
+
+class LzwDecoder:
+    def __init__(self):
+        self.starts = [0] * MAX_CODES
+        self.lengths = [0] * MAX_CODES
+        self._scratch = bytearray()
+        self._view = memoryview(self._scratch)
+
+    def _reserve(self, size: int) -> None:
+        if len(self._scratch) < size:
+            self._view.release()
+            self._scratch = bytearray(size)
+            self._view = memoryview(self._scratch)
+
+    def decode(self, data: bytes, min_code_size: int, pixel_count: int) -> memoryview:
+        self._reserve(pixel_count + MAX_CODES + 1)
+        out = self._scratch
+        view = self._view
+        starts = self.starts
+        lengths = self.lengths
+
+        clear_code = 1 << min_code_size
+        end_code = clear_code + 1
+        code_size = min_code_size + 1
+        mask = (1 << code_size) - 1
+        next_code = clear_code + 2
+
+        prev_pos = -1
+        prev_len = 0
+        pos = 0
+        acc = 0
+        bits = 0
+        i = 0
+        n = len(data)
+
+        while pos < pixel_count:
+            while bits < code_size:
+                if i >= n:
+                    return view[:pos]
+                acc |= data[i] << bits
+                i += 1
+                bits += 8
+            code = acc & mask
+            acc >>= code_size
+            bits -= code_size
+
+            if code == clear_code:
+                code_size = min_code_size + 1
+                mask = (1 << code_size) - 1
+                next_code = clear_code + 2
+                prev_pos = -1
+                continue
+            if code == end_code:
+                break
+
+            if code < clear_code:
+                out[pos] = code
+                length = 1
+            elif code < next_code:
+                start = starts[code]
+                length = lengths[code]
+                view[pos:pos + length] = view[start:start + length]
+            elif code == next_code and prev_pos >= 0:
+                view[pos:pos + prev_len] = view[prev_pos:prev_pos + prev_len]
+                out[pos + prev_len] = out[prev_pos]
+                length = prev_len + 1
+            else:
+                break
+
+            if prev_pos >= 0 and next_code < MAX_CODES:
+                starts[next_code] = prev_pos
+                lengths[next_code] = prev_len + 1
+                next_code += 1
+                if next_code > mask and code_size < 12:
+                    code_size += 1
+                    mask = (1 << code_size) - 1
+
+            prev_pos = pos
+            prev_len = length
+            pos += length
+
+        return view[:min(pos, pixel_count)]
+
+    def decode_frame(self, buf, record: FrameRecord, out=None,
+                     rows: Optional[Iterable[int]] = None):
+        width, height = record.width, record.height
+        if out is None:
+            out = bytearray(width * height)
+        target = memoryview(out).cast('B')
+
+        order = interlaced_rows(height) if record.interlaced else range(height)
+        if rows is None:
+            wanted = None
+            stream_rows = height
+        else:
+            wanted = set(rows)
+            stream_rows = max((i + 1 for i, row in enumerate(order) if row in wanted), default=0)
+
+        pixels = self.decode(read_image_data(buf, record), buf[record.data_offset], stream_rows * width)
+
+        if wanted is None and not record.interlaced:
+            target[:len(pixels)] = pixels
+            return out
+
+        for i, row in enumerate(order[:len(pixels) // width]):
+            if wanted is None or row in wanted:
+                target[row * width:(row + 1) * width] = pixels[i * width:(i + 1) * width]
+        return out
+
+
+class PillowLzwDecoder:
+    def __init__(self):
+        from PIL import Image
+
+        self._open = Image.open
+        self._fallback = LzwDecoder()
+
+    def decode_frame(self, buf, record: FrameRecord, out=None,
+                     rows: Optional[Iterable[int]] = None):
+        try:
+            with self._open(io.BytesIO(single_frame_gif(buf, record))) as image:
+                image.load()
+                pixels = image.tobytes()
+        except Exception:
+            return self._fallback.decode_frame(buf, record, out, rows)
+
+        width = record.width
+        if out is None:
+            out = bytearray(width * record.height)
+        target = memoryview(out).cast('B')
+        if rows is None:
+            target[:len(pixels)] = pixels
+        else:
+            for row in rows:
+                target[row * width:(row + 1) * width] = pixels[row * width:(row + 1) * width]
+        return out
+
+
+def default_decoder():
+    try:
+        return PillowLzwDecoder()
+    except ImportError:
+        return LzwDecoder()
@@ -0,0 +1,134 @@
+import os
+from concurrent.futures import FIRST_COMPLETED, CancelledError, ProcessPoolExecutor, wait
+from multiprocessing import get_context, shared_memory
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+from gif_compositor import DISPOSE_TO_BACKGROUND, DISPOSE_TO_PREVIOUS, FrameCompositor
+from gif_index import FrameIndex, FrameRecord
+from gif_parser import GifParser
+
+
+SEGMENTS_PER_WORKER = 4
+CANCEL_POLL_SECONDS = 0.05
+START_METHOD = 'spawn'
+
+_compositor: Optional[FrameCompositor] = None
+
+
+def covers_canvas(record: FrameRecord, width: int, height: int) -> bool:
+    return record.left == 0 and record.top == 0 and record.width >= width and record.height >= height
+
+
+def find_keyframes(frame_index: FrameIndex, width: int, height: int) -> List[int]:
+    keyframes = []
+    cleared = True
+    for n in range(len(frame_index)):
+        record = frame_index.record(n)
+        full = covers_canvas(record, width, height)
+        if cleared or (full and not record.transparency and record.disposal_method != DISPOSE_TO_PREVIOUS):
+            keyframes.append(n)
+        cleared = full and record.disposal_method == DISPOSE_TO_BACKGROUND
+    return keyframes
+
+
+def split_segments(keyframes: List[int], frame_count: int, parts: int) -> List[Tuple[int, int]]:
+    target = frame_count / max(parts, 1)
+    segments = []
+    start = 0
+    for key in keyframes[1:]:
+        if key - start >= target:
+            segments.append((start, key))
+            start = key
+    if frame_count:
+        segments.append((start, frame_count))
+    return segments
+
+
+class DecodedFrames:
+    def __init__(self, frames: np.ndarray, shm: Optional[shared_memory.SharedMemory] = None):
+        self.frames = frames
+        self._shm = shm
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def __getitem__(self, n: int) -> np.ndarray:
+        return self.frames[n]
+
+    def close(self) -> None:
+        self.frames = None
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def __enter__(self) -> 'DecodedFrames':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _init_worker(source) -> None:
+    global _compositor
+    _compositor = FrameCompositor.open(source)
+
+
+def _decode_segment(shm_name: str, shape: Tuple[int, ...], start: int, stop: int) -> int:
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        frames = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+        _compositor.reset(start - 1)
+        for n in range(start, stop):
+            frames[n] = _compositor.advance()
+        del frames
+    finally:
+        shm.close()
+    return stop - start
+
+
+def decode_frames(source, workers: Optional[int] = None, segments_per_worker: int = SEGMENTS_PER_WORKER,
+                  parser: Optional[GifParser] = None,
+                  cancelled: Optional[Callable[[], bool]] = None) -> DecodedFrames:
+    cancelled = cancelled or (lambda: False)
+    if parser is None:
+        parser = GifParser(source)
+        parser.parse_file()
+    buf = parser.buffer if parser.buffer is not None else parser.file_path.read_bytes()
+    frame_count = len(parser.frame_index)
+    shape = (frame_count, parser.height, parser.width, 4)
+
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    segments = split_segments(find_keyframes(parser.frame_index, parser.width, parser.height), frame_count,
+                              workers * segments_per_worker)
+    if workers <= 1 or len(segments) <= 1:
+        frames = np.empty(shape, dtype=np.uint8)
+        for n, canvas in enumerate(FrameCompositor(buf, parser)):
+            if cancelled():
+                raise CancelledError()
+            frames[n] = canvas
+        return DecodedFrames(frames)
+
+    worker_source = parser.file_path if parser.file_path is not None else bytes(buf)
+    shm = shared_memory.SharedMemory(create=True, size=int(np.prod(shape)))
+    executor = ProcessPoolExecutor(max_workers=min(workers, len(segments)), mp_context=get_context(START_METHOD),
+                                   initializer=_init_worker, initargs=(worker_source,))
+    finished = False
+    try:
+        pending = {executor.submit(_decode_segment, shm.name, shape, start, stop) for start, stop in segments}
+        while pending:
+            if cancelled():
+                raise CancelledError()
+            done, pending = wait(pending, timeout=CANCEL_POLL_SECONDS, return_when=FIRST_COMPLETED)
+            for future in done:
+                future.result()
+        finished = True
+    except BaseException:
+        shm.close()
+        shm.unlink()
+        raise
+    finally:
+        executor.shutdown(wait=finished, cancel_futures=True)
+    return DecodedFrames(np.ndarray(shape, dtype=np.uint8, buffer=shm.buf), shm)
@@ -1,49 +1,283 @@
+import mmap
 import struct
-from typing import BinaryIO, Dict
+import sys
+import time
+from typing import BinaryIO, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
 from pathlib import Path
 
+from gif_blocks import (APPLICATION_LABEL, COMMENT_LABEL, DEADLINE_CHECK_INTERVAL, EXTENSION_INTRODUCER,
+                        GRAPHICS_CONTROL_LABEL, IMAGE_DESCRIPTOR, IMAGE_SEPARATOR, LOGICAL_SCREEN_DESCRIPTOR,
+                        NO_CONTROL, TRAILER, Block, ExtensionBlock, GraphicsControlBlock, HeaderBlock, ImageBlock,
+                        ScreenDescriptorBlock, TrailerBlock, iter_blocks, iter_frame_blocks, read_header,
+                        read_screen_descriptor, skip_sub_blocks)
+from gif_index import FrameIndex, FrameInfoView, FrameRecord
+
+
+_LOOP_COUNT = struct.Struct("<BH")
+
+_HEADER_SIZE = 6 + LOGICAL_SCREEN_DESCRIPTOR.size
+
+_CACHED_STATE = ('width', 'height', 'global_color_table_flag', 'global_color_table_size', 'global_color_table_offset',
+                 'headers_info', 'frame_count', 'file_size', 'total_duration')
+
+PARSE_LEVELS = ('header', 'summary', 'full')
+
+
+class ParseLimits(NamedTuple):
+    max_frames: Optional[int] = None
+    max_canvas_pixels: Optional[int] = None
+    max_bytes: Optional[int] = None
+    max_frame_pixels: Optional[int] = None
+    max_seconds: Optional[float] = None
+
+
+class GifLimitExceeded(Exception):
+    def __init__(self, limit: str, value, maximum, partial: Dict):
+        super().__init__(f"Limit {limit} exceeded: {value} > {maximum}")
+        self.limit = limit
+        self.value = value
+        self.maximum = maximum
+        self.partial = partial
+
 
 class GifParser:
-    def __init__(self, file_path: Path):
-        self.file_path = file_path
+    MMAP_RELEASE_WINDOW = 16 * 1024 * 1024
+
+    def __init__(self, file_path: Union[Path, str, bytes, bytearray, memoryview, BinaryIO], use_mmap: bool = False,
+                 index_sidecar: bool = False, cache=None, limits: Optional[ParseLimits] = None):
+        self.limits = limits
+        self._started = None
+        self._deadline = None
+        self.file_path = None
+        self._source = None
+        if isinstance(file_path, (bytes, bytearray, memoryview)):
+            self._source = memoryview(file_path).cast('B')
+        elif hasattr(file_path, 'read'):
+            self._source = file_path
+        else:
+            self.file_path = Path(file_path)
+        if self.file_path is None and (index_sidecar or cache is not None):
+            raise ValueError("Index sidecar and analysis cache require a file path")
+        self.use_mmap = use_mmap
+        self.index_sidecar = index_sidecar
+        self.cache = cache
+        self._mapped = None
+        self._released = 0
+        self._reset()
+
+    def _reset(self) -> None:
+        self.from_cache = False
+        self.frame_index = FrameIndex()
+        self._indexed = False
         self.width = 0
         self.height = 0
-        self.global_color_table = []
-        self.frames_info = []
+        self.global_color_table_flag = False
+        self.global_color_table_size = 0
+        self.global_color_table_offset = -1
+        self.buffer = None
         self.headers_info = {}
         self.frame_count = 0
         self.file_size = 0
         self.total_duration = 0
 
-    def parse_file(self) -> Dict:
+    def parse_file(self, level: str = 'full') -> Dict:
+        if level not in PARSE_LEVELS:
+            raise ValueError(f"Unknown parse level {level!r}, expected one of {', '.join(PARSE_LEVELS)}")
+        self._reset()
+        if self.limits is not None and self.limits.max_seconds is not None:
+            self._started = time.perf_counter()
+            self._deadline = self._started + self.limits.max_seconds
+        if self.file_path is None:
+            self.buffer = self._read_source()
+            self.file_size = len(self.buffer)
+            self._parse_buffer(self._cap(self.buffer), level)
+            if level == 'full':
+                self._indexed = True
+            return self.get_info()
+
         if not self.file_path.exists():
             raise FileNotFoundError(f"File {self.file_path} not found")
 
         self.file_size = self.file_path.stat().st_size
 
+        if self.cache is not None and self._load_from_cache():
+            if self.limits is not None:
+                self._check_cached_limits()
+            return self.get_info()
+
         with self.file_path.open('rb') as f:
-            self._parse_header(f)
-            self._parse_logical_screen_descriptor(f)
-            self._parse_global_color_table(f)
-            self._parse_frames(f)
+            mapped = self._map_file(f) if self.use_mmap else None
+            if mapped is None:
+                if level == 'header':
+                    data = f.read(_HEADER_SIZE)
+                elif self.limits is not None and self.limits.max_bytes is not None:
+                    data = f.read(self.limits.max_bytes + 1)
+                else:
+                    data = f.read()
+                self.buffer = memoryview(data)
+                self._parse_buffer(self.buffer, level)
+            else:
+                self._mapped, self._released = mapped, 0
+                try:
+                    with mapped, memoryview(mapped) as buf, self._cap(buf) as capped:
+                        self._parse_buffer(capped, level)
+                finally:
+                    self._mapped = None
+
+        if level != 'full':
+            return self.get_info()
+
+        self._indexed = True
+        if self.index_sidecar:
+            self._save_sidecar()
+        if self.cache is not None:
+            self._store_in_cache()
 
         return self.get_info()
 
-    def _parse_header(self, f: BinaryIO) -> None:
-        header = f.read(6)
-        signature = header[:3].decode('ascii')
-        version = header[3:6].decode('ascii')
+    def _load_from_cache(self) -> bool:
+        try:
+            cached = self.cache.get(self.file_path)
+        except Exception as e:
+            print(f"Error reading analysis cache: {str(e)}", file=sys.stderr)
+            return False
+        if cached is None:
+            return False
+
+        state, frame_index = cached
+        if any(name not in state for name in _CACHED_STATE):
+            return False
+        self.frame_index = frame_index
+        for name in _CACHED_STATE:
+            setattr(self, name, state[name])
+        self._indexed = True
+        self.from_cache = True
+        return True
+
+    def _store_in_cache(self) -> None:
+        try:
+            self.cache.put(self.file_path, {name: getattr(self, name) for name in _CACHED_STATE}, self.frame_index)
+        except Exception as e:
+            print(f"Error writing analysis cache: {str(e)}", file=sys.stderr)
+
+    @property
+    def frames_info(self) -> FrameInfoView:
+        return FrameInfoView(self.frame_index)
+
+    @property
+    def sidecar_path(self) -> Path:
+        return self.file_path.with_name(self.file_path.name + '.idx')
+
+    def _file_stamp(self) -> Tuple[int, int]:
+        stat = self.file_path.stat()
+        return stat.st_size, stat.st_mtime_ns
+
+    def _save_sidecar(self) -> None:
+        try:
+            self.frame_index.save(self.sidecar_path, self._file_stamp())
+        except OSError as e:
+            print(f"Error saving frame index: {str(e)}", file=sys.stderr)
+
+    def load_frame_index(self) -> FrameIndex:
+        if self.index_sidecar:
+            index = FrameIndex.load(self.sidecar_path, self._file_stamp())
+            if index is not None:
+                self.frame_index = index
+                self._indexed = True
+                return index
+
+        self.parse_file()
+        return self.frame_index
+
+    def get_frame_record(self, n: int) -> FrameRecord:
+        if not self._indexed:
+            self.load_frame_index()
+        return self.frame_index.record(n)
+
+    def _map_file(self, f: BinaryIO) -> Optional[mmap.mmap]:
+        try:
+            if not f.seekable():
+                return None
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+
+        if hasattr(mmap, 'MADV_SEQUENTIAL'):
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+        return mapped
+
+    def _release_scanned_pages(self, pos: int) -> None:
+        if self._mapped is None or pos - self._released < self.MMAP_RELEASE_WINDOW:
+            return
+        if not hasattr(mmap, 'MADV_DONTNEED'):
+            return
+
+        end = pos - pos % mmap.PAGESIZE
+        self._mapped.madvise(mmap.MADV_DONTNEED, self._released, end - self._released)
+        self._released = end
+
+    def _read_source(self) -> memoryview:
+        if hasattr(self._source, 'read'):
+            if self.limits is not None and self.limits.max_bytes is not None:
+                self._source = memoryview(self._source.read(self.limits.max_bytes + 1))
+            else:
+                self._source = memoryview(self._source.read())
+        return self._source
+
+    def iter_blocks(self) -> Iterator[Block]:
+        if self.file_path is None:
+            yield from iter_blocks(self._read_source())
+            return
+        if not self.file_path.exists():
+            raise FileNotFoundError(f"File {self.file_path} not found")
+
+        with self.file_path.open('rb') as f:
+            mapped = self._map_file(f) if self.use_mmap else None
+            if mapped is None:
+                yield from iter_blocks(memoryview(f.read()))
+                return
+            with mapped, memoryview(mapped) as buf:
+                yield from iter_blocks(buf)
+
+    def _cap(self, buf: memoryview) -> memoryview:
+        if self.limits is not None and self.limits.max_bytes is not None:
+            return buf[:self.limits.max_bytes + 1]
+        return buf[:]
+
+    def _parse_buffer(self, buf: memoryview, level: str = 'full') -> None:
+        pos = self._parse_header(buf, 0)
+        pos = self._parse_logical_screen_descriptor(buf, pos)
+        if level == 'header':
+            return
+        if level == 'summary':
+            if self.global_color_table_flag:
+                pos += self.global_color_table_size * 3
+            complete = self._count_frames(buf, pos)
+        else:
+            pos = self._parse_global_color_table(buf, pos)
+            complete = self._parse_frames(buf, pos)
+        if not complete and self.limits is not None:
+            self._check_limit('max_bytes', len(buf))
 
+    def _parse_header(self, buf: memoryview, pos: int) -> int:
+        block = read_header(buf, pos)
+        self._add_header(block)
+        return pos + block.length
+
+    def _add_header(self, block: HeaderBlock) -> None:
         self.headers_info['Header'] = {
-            'Signature': (signature, 'GIF signature'),
-            'Version': (version, 'GIF version')
+            'Signature': (block.signature, 'GIF signature'),
+            'Version': (block.version, 'GIF version')
         }
 
-    def _parse_logical_screen_descriptor(self, f: BinaryIO) -> None:
-        self.width, self.height = struct.unpack("<HH", f.read(4))
-        packed = struct.unpack("<B", f.read(1))[0]
-        background_color = struct.unpack("<B", f.read(1))[0]
-        aspect_ratio = struct.unpack("<B", f.read(1))[0]
+    def _parse_logical_screen_descriptor(self, buf: memoryview, pos: int) -> int:
+        self._add_screen_descriptor(read_screen_descriptor(buf, pos))
+        return pos + LOGICAL_SCREEN_DESCRIPTOR.size
+
+    def _add_screen_descriptor(self, block: ScreenDescriptorBlock) -> None:
+        self.width, self.height, packed = block.width, block.height, block.flags
+        if self.limits is not None:
+            self._check_limit('max_canvas_pixels', self.width * self.height)
 
         global_color_table_flag = bool(packed & 0b10000000)
         color_resolution = ((packed & 0b01110000) >> 4) + 1
@@ -56,146 +290,207 @@ class GifParser:
             'Color Resolution': (color_resolution, 'Bits per primary color'),
             'Sort Flag': (sort_flag, 'Whether colors are sorted'),
             'Color Table Size': (global_color_table_size, 'Number of entries in global color table'),
-            'Background Color': (background_color, 'Background color index'),
-            'Aspect Ratio': (aspect_ratio, 'Pixel aspect ratio')
+            'Background Color': (block.background_color, 'Background color index'),
+            'Aspect Ratio': (block.aspect_ratio, 'Pixel aspect ratio')
         }
 
         self.global_color_table_flag = global_color_table_flag
         self.global_color_table_size = global_color_table_size
 
-    def _parse_global_color_table(self, f: BinaryIO) -> None:
-        if self.global_color_table_flag:
-            table_size = self.global_color_table_size * 3
-            color_table = f.read(table_size)
-
-            for i in range(0, table_size, 3):
-                r, g, b = color_table[i:i + 3]
-                self.global_color_table.append((r, g, b))
-
-    def _parse_frames(self, f: BinaryIO) -> None:
-        current_frame_data = None
-
-        while True:
+    def _parse_global_color_table(self, buf: memoryview, pos: int) -> int:
+        if not self.global_color_table_flag:
+            return pos
+
+        self.global_color_table_offset = pos
+        return pos + self.global_color_table_size * 3
+
+    @property
+    def global_color_table(self) -> List[Tuple[int, int, int]]:
+        table = self.color_table()
+        return [] if table is None else [tuple(color) for color in table.tolist()]
+
+    def color_table(self, n: Optional[int] = None) -> Optional[memoryview]:
+        if n is not None:
+            local_table = self.local_color_table(n)
+            if local_table is not None:
+                return local_table
+        if self.global_color_table_offset < 0:
+            return None
+        return self._table_view(self.global_color_table_offset, self.global_color_table_size)
+
+    def local_color_table(self, n: int) -> Optional[memoryview]:
+        record = self.get_frame_record(n)
+        if record.color_table_offset < 0:
+            return None
+        return self._table_view(record.color_table_offset, record.color_table_size)
+
+    def _table_view(self, offset: int, size: int) -> memoryview:
+        if self.buffer is not None:
+            table = self.buffer[offset:offset + 3 * size]
+        else:
+            with self.file_path.open('rb') as f:
+                f.seek(offset)
+                table = memoryview(f.read(3 * size))
+        return table.cast('B', (len(table) // 3, 3))
+
+    def _parse_frames(self, buf: memoryview, pos: int) -> bool:
+        control = NO_CONTROL
+        append = self.frame_index.append
+        limits = self.limits
+        try:
+            for block in iter_frame_blocks(buf, pos, self._deadline):
+                kind = type(block)
+                if limits is not None:
+                    self._check_scan(block.offset + block.length)
+                if kind is ImageBlock:
+                    (offset, length, left, top, width, height, flags, color_table_offset, data_offset,
+                     min_code_size, compressed_size, sub_block_count) = block
+                    if limits is not None:
+                        self._check_frame(width, height)
+                    append(control[0], offset, color_table_offset, data_offset, offset + length,
+                           left, top, width, height, flags, control[1], control[2], control[3],
+                           compressed_size, sub_block_count, min_code_size)
+                    control = NO_CONTROL
+                    self.frame_count += 1
+                    self._release_scanned_pages(offset + length)
+                elif kind is GraphicsControlBlock:
+                    self.total_duration += block.delay * 10
+                    control = (block.offset, block.flags, block.delay, block.transparent_index)
+                elif kind is ExtensionBlock:
+                    self._add_extension(buf, block)
+                elif kind is TrailerBlock:
+                    return True
+        except GifLimitExceeded:
+            raise
+        except TimeoutError:
+            self._check_deadline()
+        except Exception as e:
+            print(f"Error parsing frame: {str(e)}", file=sys.stderr)
+        return False
+
+    def _count_frames(self, buf: memoryview, pos: int) -> bool:
+        end = len(buf)
+        skip = skip_sub_blocks
+        limits = self.limits
+        deadline = self._deadline
+
+        while pos < end:
             try:
-                block_type = f.read(1)
-                if not block_type:
-                    break
-
-                if block_type == b'\x2C':
-                    current_frame_data = self._parse_image_descriptor(f)
-                    if current_frame_data:
-                        self.frames_info.append(current_frame_data)
-                        self.frame_count += 1
-
-                elif block_type == b'\x21':
-                    extension_type = f.read(1)
-                    if extension_type == b'\xF9':
-                        if current_frame_data is None:
-                            current_frame_data = {}
-                        self._parse_graphics_control_extension(f, current_frame_data)
-                    elif extension_type == b'\xFF':
-                        self._parse_application_extension(f)
-                    elif extension_type == b'\xFE':
-                        self._parse_comment_extension(f)
-                    self._skip_data_blocks(f)
-                elif block_type == b'\x3B':
-                    break
+                if limits is not None:
+                    self._check_scan(pos)
+                block_type = buf[pos]
+
+                if block_type == IMAGE_SEPARATOR:
+                    if limits is not None:
+                        self._check_frame(buf[pos + 5] | buf[pos + 6] << 8, buf[pos + 7] | buf[pos + 8] << 8)
+                    packed = buf[pos + 9]
+                    pos += 1 + IMAGE_DESCRIPTOR.size
+                    if packed & 0b10000000:
+                        pos += 3 * (2 << (packed & 0b00000111))
+                    pos = skip(buf, pos + 1, deadline)
+                    self.frame_count += 1
+                    self._release_scanned_pages(pos)
+
+                elif block_type == EXTENSION_INTRODUCER:
+                    extension_type = buf[pos + 1]
+                    pos += 2
+                    if extension_type == GRAPHICS_CONTROL_LABEL:
+                        self.total_duration += (buf[pos + 2] | buf[pos + 3] << 8) * 10
+                        pos = skip(buf, pos + 1 + buf[pos], deadline)
+                    elif extension_type == APPLICATION_LABEL:
+                        pos = self._parse_application_extension(buf, pos)
+                    elif extension_type == COMMENT_LABEL:
+                        pos = self._parse_comment_extension(buf, pos)
+                    else:
+                        pos = skip(buf, pos, deadline)
+                elif block_type == TRAILER:
+                    return True
+                else:
+                    pos += 1
+            except GifLimitExceeded:
+                raise
+            except TimeoutError:
+                self._check_deadline()
             except Exception as e:
-                print(f"Error parsing frame: {str(e)}")
+                print(f"Error parsing frame: {str(e)}", file=sys.stderr)
                 break
-
-    def _parse_image_descriptor(self, f: BinaryIO) -> Dict:
-        left, top, width, height = struct.unpack("<HHHH", f.read(8))
-        packed = struct.unpack("<B", f.read(1))[0]
-
-        local_color_table_flag = bool(packed & 0b10000000)
-        interlace_flag = bool(packed & 0b01000000)
-        sort_flag = bool(packed & 0b00100000)
-        local_color_table_size = 2 << (packed & 0b00000111)
-
-        frame_info = {
-            'Position': (left, top),
-            'Size': f"{width}x{height}",
-            'Local Color Table': local_color_table_flag,
-            'Interlaced': interlace_flag,
-            'Sort Flag': sort_flag,
-            'Color Table Size': local_color_table_size
-        }
-
-        if local_color_table_flag:
-            f.seek(3 * local_color_table_size, 1)
-
-        f.read(1)
-        self._skip_data_blocks(f)
-        return frame_info
-
-    def _parse_graphics_control_extension(self, f: BinaryIO, frame_info: Dict) -> None:
-        f.read(1)
-        packed = struct.unpack("<B", f.read(1))[0]
-        delay_time = struct.unpack("<H", f.read(2))[0]
-        transparent_color_index = struct.unpack("<B", f.read(1))[0]
-
-        disposal_method = (packed & 0b00011100) >> 2
-        user_input_flag = bool(packed & 0b00000010)
-        transparency_flag = bool(packed & 0b00000001)
-
-        disposal_methods = [
-            "No disposal specified",
-            "Do not dispose",
-            "Restore to background",
-            "Restore to previous"
-        ]
-
-        delay_ms = delay_time * 10
-        self.total_duration += delay_ms
-
-        frame_info.update({
-            'Delay': f"{delay_ms}ms",
-            'Disposal Method': disposal_methods[disposal_method] if disposal_method < len(
-                disposal_methods) else f"Unknown ({disposal_method})",
-            'User Input': user_input_flag,
-            'Transparency': transparency_flag,
-            'Transparent Color': transparent_color_index if transparency_flag else None
-        })
-
-    def _parse_application_extension(self, f: BinaryIO) -> None:
-        block_size = struct.unpack("<B", f.read(1))[0]
-        app_data = f.read(block_size)
+        return False
+
+    def _check_limit(self, limit: str, value) -> None:
+        maximum = getattr(self.limits, limit)
+        if maximum is not None and value > maximum:
+            raise GifLimitExceeded(limit, value, maximum, self.get_info())
+
+    def _check_scan(self, pos: int) -> None:
+        max_bytes = self.limits.max_bytes
+        if max_bytes is not None and pos > max_bytes:
+            self._check_limit('max_bytes', pos)
+        self._check_deadline()
+
+    def _check_deadline(self) -> None:
+        if self._started is not None:
+            self._check_limit('max_seconds', time.perf_counter() - self._started)
+
+    def _check_frame(self, width: int, height: int) -> None:
+        self._check_limit('max_frames', self.frame_count + 1)
+        self._check_limit('max_frame_pixels', width * height)
+
+    def _check_cached_limits(self) -> None:
+        self._check_limit('max_canvas_pixels', self.width * self.height)
+        self._check_limit('max_frames', self.frame_count)
+        self._check_limit('max_bytes', self.file_size)
+        columns = self.frame_index.columns
+        if columns['width']:
+            self._check_limit('max_frame_pixels', max(map(int.__mul__, columns['width'], columns['height'])))
+
+    def _add_extension(self, buf: memoryview, block: ExtensionBlock) -> None:
+        if block.label == APPLICATION_LABEL and block.identifier.startswith(b'NETSCAPE2.0'):
+            self._parse_netscape_extension(buf, block.data_offset)
+        elif block.label == COMMENT_LABEL:
+            self._parse_comment_extension(buf, block.data_offset)
+
+    def _parse_application_extension(self, buf: memoryview, pos: int) -> int:
+        block_size = buf[pos]
+        app_data = bytes(buf[pos + 1:pos + 1 + block_size])
+        pos += 1 + block_size
         if app_data.startswith(b'NETSCAPE2.0'):
-            self._parse_netscape_extension(f)
-        else:
-            self._skip_data_blocks(f)
+            return self._parse_netscape_extension(buf, pos)
+        return self._skip_data_blocks(buf, pos)
 
-    def _parse_netscape_extension(self, f: BinaryIO) -> None:
+    def _parse_netscape_extension(self, buf: memoryview, pos: int) -> int:
+        count = 0
         while True:
-            block_size = struct.unpack("<B", f.read(1))[0]
+            block_size = buf[pos]
+            pos += 1
             if block_size == 0:
-                break
+                return pos
+            count += 1
+            if self._deadline is not None and not count % DEADLINE_CHECK_INTERVAL:
+                self._check_deadline()
             if block_size == 3:
-                f.read(1)
-                iterations = struct.unpack("<H", f.read(2))[0]
+                _, iterations = _LOOP_COUNT.unpack_from(buf, pos)
                 self.headers_info.setdefault('Metadata', {})['Loop Count'] = (
                 iterations, 'Number of animation iterations (0 = infinite)')
-            else:
-                f.read(block_size)
+            pos += block_size
 
-    def _parse_comment_extension(self, f: BinaryIO) -> None:
+    def _parse_comment_extension(self, buf: memoryview, pos: int) -> int:
         comment = []
         while True:
-            block_size = struct.unpack("<B", f.read(1))[0]
+            block_size = buf[pos]
+            pos += 1
             if block_size == 0:
                 break
-            comment.append(f.read(block_size).decode('ascii', errors='ignore'))
+            if self._deadline is not None and not len(comment) % DEADLINE_CHECK_INTERVAL:
+                self._check_deadline()
+            comment.append(bytes(buf[pos:pos + block_size]).decode('ascii', errors='ignore'))
+            pos += block_size
 
         if comment:
             self.headers_info.setdefault('Metadata', {})['Comment'] = (''.join(comment), 'GIF comment data')
+        return pos
 
-    def _skip_data_blocks(self, f: BinaryIO) -> None:
-        while True:
-            block_size = f.read(1)
-            if not block_size or block_size == b'\x00':
-                break
-            f.seek(struct.unpack("<B", block_size)[0], 1)
+    def _skip_data_blocks(self, buf: memoryview, pos: int) -> int:
+        return skip_sub_blocks(buf, pos, self._deadline)
 
     def _format_size(self, size_bytes):
         for unit in ['B', 'KB', 'MB']:
@@ -0,0 +1,63 @@
+import time
+from typing import Callable, Optional, Sequence
+
+
+DEFAULT_DELAY_MS = 100
+
+
+class PlaybackScheduler:
+    def __init__(self, delays_ms: Sequence[int], speed: float = 1.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.delays = [(delay if delay > 0 else DEFAULT_DELAY_MS) / 1000 for delay in delays_ms]
+        self.speed = speed
+        self.clock = clock
+        self.index = 0
+        self.deadline = 0.0
+        self.started = 0.0
+        self.advanced = 0
+        self.skipped = 0
+
+    def start(self, index: int = 0) -> None:
+        now = self.clock()
+        self.index = index
+        self.deadline = now + self.delays[index] / self.speed
+        self.started = now
+        self.advanced = 0
+        self.skipped = 0
+
+    def set_speed(self, speed: float) -> None:
+        now = self.clock()
+        remaining = max(self.deadline - now, 0.0) * self.speed / speed
+        self.speed = speed
+        self.deadline = now + remaining
+
+    def wait_ms(self) -> int:
+        return max(0, round((self.deadline - self.clock()) * 1000))
+
+    def advance(self, limit: Optional[int] = None) -> int:
+        count = len(self.delays) if limit is None else max(1, min(limit, len(self.delays)))
+        now = self.clock()
+
+        cycle = sum(self.delays[:count]) / self.speed
+        if now - self.deadline > cycle:
+            self.skipped += count
+            self.deadline = now
+
+        index = (self.index + 1) % count
+        deadline = self.deadline + self.delays[index] / self.speed
+        while deadline <= now:
+            index = (index + 1) % count
+            deadline += self.delays[index] / self.speed
+            self.skipped += 1
+
+        self.index = index
+        self.deadline = deadline
+        self.advanced += 1
+        return index
+
+    def achieved_fps(self) -> float:
+        elapsed = self.clock() - self.started
+        return self.advanced / elapsed if elapsed > 0 else 0.0
+
+    def intended_fps(self) -> float:
+        return len(self.delays) * self.speed / sum(self.delays) if self.delays else 0.0
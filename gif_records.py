@@ -0,0 +1,161 @@
+import json
+import struct
+from typing import BinaryIO, Dict, Iterator, Optional, TextIO
+
+from gif_index import FrameIndex
+from gif_parser import GifParser
+
+
+RECORD_FORMATS = ('jsonl', 'msgpack')
+
+_FLOAT64 = struct.Struct(">d")
+
+
+def file_record(parser: GifParser, path: Optional[str] = None) -> Dict:
+    metadata = parser.headers_info.get('Metadata', {})
+    screen = parser.headers_info.get('Logical Screen Descriptor', {})
+    header = parser.headers_info.get('Header', {})
+    if path is None and parser.file_path is not None:
+        path = str(parser.file_path)
+    return {
+        'type': 'file',
+        'path': path,
+        'version': header.get('Version', (None,))[0],
+        'width': parser.width,
+        'height': parser.height,
+        'file_size': parser.file_size,
+        'frame_count': parser.frame_count,
+        'duration_ms': parser.total_duration,
+        'global_color_table_size': parser.global_color_table_size if parser.global_color_table_flag else 0,
+        'background_color': screen.get('Background Color', (None,))[0],
+        'loop_count': metadata.get('Loop Count', (None,))[0],
+    }
+
+
+def frame_records(frame_index: FrameIndex) -> Iterator[Dict]:
+    for n in range(len(frame_index)):
+        record = frame_index.record(n)
+        yield {
+            'type': 'frame',
+            'index': n,
+            'left': record.left,
+            'top': record.top,
+            'width': record.width,
+            'height': record.height,
+            'delay_ms': record.delay * 10,
+            'disposal_method': record.disposal_method,
+            'transparent_index': record.transparent_index if record.transparency else None,
+            'interlaced': record.interlaced,
+            'local_color_table_size': record.color_table_size,
+            'offset': record.descriptor_offset,
+            'data_offset': record.data_offset,
+            'data_end': record.data_end,
+            'compressed_size': record.compressed_size,
+            'sub_block_count': record.sub_block_count,
+            'min_code_size': record.min_code_size,
+            'bytes_per_pixel': record.bytes_per_pixel,
+        }
+
+
+def iter_records(parser: GifParser, path: Optional[str] = None) -> Iterator[Dict]:
+    yield file_record(parser, path)
+    yield from frame_records(parser.frame_index)
+
+
+def error_record(path: str, error: str) -> Dict:
+    return {'type': 'error', 'path': str(path), 'error': error}
+
+
+def pack(obj) -> bytes:
+    out = bytearray()
+    _pack_into(out, obj)
+    return bytes(out)
+
+
+def _pack_into(out: bytearray, obj) -> None:
+    if obj is None:
+        out.append(0xC0)
+    elif obj is True:
+        out.append(0xC3)
+    elif obj is False:
+        out.append(0xC2)
+    elif isinstance(obj, int):
+        _pack_int(out, obj)
+    elif isinstance(obj, float):
+        out.append(0xCB)
+        out += _FLOAT64.pack(obj)
+    elif isinstance(obj, str):
+        data = obj.encode('utf-8')
+        _pack_header(out, len(data), 0xA0, 32, (0xD9, 0xDA, 0xDB))
+        out += data
+    elif isinstance(obj, (bytes, bytearray, memoryview)):
+        data = bytes(obj)
+        _pack_header(out, len(data), None, 0, (0xC4, 0xC5, 0xC6))
+        out += data
+    elif isinstance(obj, (list, tuple)):
+        _pack_header(out, len(obj), 0x90, 16, (None, 0xDC, 0xDD))
+        for item in obj:
+            _pack_into(out, item)
+    elif isinstance(obj, dict):
+        _pack_header(out, len(obj), 0x80, 16, (None, 0xDE, 0xDF))
+        for key, value in obj.items():
+            _pack_into(out, key)
+            _pack_into(out, value)
+    else:
+        raise TypeError(f"Cannot pack {type(obj).__name__}")
+
+
+def _pack_int(out: bytearray, value: int) -> None:
+    if 0 <= value < 0x80:
+        out.append(value)
+    elif -32 <= value < 0:
+        out.append(value & 0xFF)
+    elif value >= 0:
+        for code, fmt in ((0xCC, ">B"), (0xCD, ">H"), (0xCE, ">I"), (0xCF, ">Q")):
+            if value < 1 << (8 * struct.calcsize(fmt)):
+                out.append(code)
+                out += struct.pack(fmt, value)
+                return
+        raise OverflowError(f"Integer {value} too large to pack")
+    else:
+        for code, fmt in ((0xD0, ">b"), (0xD1, ">h"), (0xD2, ">i"), (0xD3, ">q")):
+            if value >= -(1 << (8 * struct.calcsize(fmt) - 1)):
+                out.append(code)
+                out += struct.pack(fmt, value)
+                return
+        raise OverflowError(f"Integer {value} too small to pack")
+
+
+def _pack_header(out: bytearray, length: int, fix_code: Optional[int], fix_limit: int, codes: tuple) -> None:
+    if fix_code is not None and length < fix_limit:
+        out.append(fix_code | length)
+        return
+    for code, fmt in zip(codes, (">B", ">H", ">I")):
+        if code is not None and length < 1 << (8 * struct.calcsize(fmt)):
+            out.append(code)
+            out += struct.pack(fmt, length)
+            return
+    raise OverflowError(f"Length {length} too large to pack")
+
+
+class JsonLinesWriter:
+    def __init__(self, out: TextIO):
+        self.out = out
+
+    def write(self, record: Dict) -> None:
+        self.out.write(json.dumps(record, separators=(',', ':')))
+        self.out.write('\n')
+
+    def flush(self) -> None:
+        self.out.flush()
+
+
+class MsgpackWriter:
+    def __init__(self, out: BinaryIO):
+        self.out = out
+
+    def write(self, record: Dict) -> None:
+        self.out.write(pack(record))
+
+    def flush(self) -> None:
+        self.out.flush()
@@ -0,0 +1,201 @@
+from typing import Callable, List, Optional
+
+from gif_index import FrameIndex, FrameRecord
+from gif_blocks import (APPLICATION_LABEL, COMMENT_LABEL, EXTENSION_INTRODUCER, GRAPHICS_CONTROL_LABEL,
+                        IMAGE_DESCRIPTOR, IMAGE_SEPARATOR, LOGICAL_SCREEN_DESCRIPTOR, NO_CONTROL, TRAILER)
+
+
+_HEADER_SIZE = 6 + LOGICAL_SCREEN_DESCRIPTOR.size
+_DESCRIPTOR_SIZE = 1 + IMAGE_DESCRIPTOR.size
+
+
+class GifStreamParser:
+    def __init__(self):
+        self.frame_index = FrameIndex()
+        self.version = None
+        self.width = 0
+        self.height = 0
+        self.global_color_table_flag = False
+        self.global_color_table_size = 0
+        self.background_color = 0
+        self.frame_count = 0
+        self.total_duration = 0
+        self.loop_count = None
+        self.comments = []
+        self.finished = False
+
+        self._buf = bytearray()
+        self._pos = 0
+        self._base = 0
+        self._events = []
+        self._state = self._read_header
+        self._control = NO_CONTROL
+        self._chunks: Optional[List[bytes]] = None
+        self._on_blocks_done: Optional[Callable[[], None]] = None
+        self._block_offset = 0
+        self._frame = None
+        self._sub_block_count = 0
+        self._extension_handlers = {GRAPHICS_CONTROL_LABEL: self._finish_graphics_control,
+                                    APPLICATION_LABEL: self._finish_application, COMMENT_LABEL: self._finish_comment}
+
+    @property
+    def offset(self) -> int:
+        return self._base + self._pos
+
+    def feed(self, data) -> List[tuple]:
+        if self.finished:
+            return []
+        self._buf += data
+        while not self.finished and self._state():
+            pass
+        self._compact()
+        events, self._events = self._events, []
+        return events
+
+    def close(self) -> None:
+        if not self.finished:
+            raise ValueError(f"Truncated GIF: stream ended at offset {self._base + len(self._buf)}")
+
+    def _compact(self) -> None:
+        drop = min(self._pos, len(self._buf))
+        if drop:
+            del self._buf[:drop]
+            self._base += drop
+            self._pos -= drop
+
+    def _available(self, size: int) -> bool:
+        return len(self._buf) - self._pos >= size
+
+    def _read_header(self) -> bool:
+        buf, pos = self._buf, self._pos
+        if self._available(3) and buf[pos:pos + 3] != b'GIF':
+            raise ValueError("Not a GIF file")
+        if not self._available(_HEADER_SIZE):
+            return False
+
+        self.version = bytes(buf[pos + 3:pos + 6]).decode('ascii', errors='replace')
+        self.width, self.height, packed, self.background_color, _ = \
+            LOGICAL_SCREEN_DESCRIPTOR.unpack_from(buf, pos + 6)
+        self.global_color_table_flag = bool(packed & 0b10000000)
+        self.global_color_table_size = 2 << (packed & 0b00000111)
+
+        self._events.append(('header', {
+            'version': self.version,
+            'width': self.width,
+            'height': self.height,
+            'global_color_table_size': self.global_color_table_size if self.global_color_table_flag else 0,
+            'background_color': self.background_color,
+        }))
+        self._pos += _HEADER_SIZE
+        if self.global_color_table_flag:
+            self._pos += 3 * self.global_color_table_size
+        self._state = self._read_block
+        return True
+
+    def _read_block(self) -> bool:
+        if not self._available(1):
+            return False
+        block_type = self._buf[self._pos]
+
+        if block_type == TRAILER:
+            self._pos += 1
+            self.finished = True
+            self._events.append(('end',))
+            return True
+        if block_type == IMAGE_SEPARATOR:
+            return self._read_image_descriptor()
+        if block_type == EXTENSION_INTRODUCER:
+            if not self._available(2):
+                return False
+            label = self._buf[self._pos + 1]
+            self._block_offset = self.offset
+            self._pos += 2
+            handler = self._extension_handlers.get(label)
+            self._start_sub_blocks(handler, collect=handler is not None)
+            return True
+        raise ValueError(f"Unexpected block 0x{block_type:02X} at offset {self.offset}")
+
+    def _read_image_descriptor(self) -> bool:
+        if not self._available(_DESCRIPTOR_SIZE):
+            return False
+        left, top, width, height, packed = IMAGE_DESCRIPTOR.unpack_from(self._buf, self._pos + 1)
+        table_size = 3 * (2 << (packed & 0b00000111)) if packed & 0b10000000 else 0
+        if not self._available(_DESCRIPTOR_SIZE + table_size + 1):
+            return False
+
+        descriptor_offset = self.offset
+        color_table_offset = descriptor_offset + _DESCRIPTOR_SIZE if table_size else -1
+        data_offset = descriptor_offset + _DESCRIPTOR_SIZE + table_size
+        min_code_size = self._buf[self._pos + _DESCRIPTOR_SIZE + table_size]
+        self._frame = (descriptor_offset, color_table_offset, data_offset, left, top, width, height, packed,
+                       min_code_size)
+        self._pos += _DESCRIPTOR_SIZE + table_size + 1
+        self._start_sub_blocks(self._finish_frame, collect=False)
+        return True
+
+    def _start_sub_blocks(self, on_done: Optional[Callable[[], None]], collect: bool) -> None:
+        self._chunks = [] if collect else None
+        self._sub_block_count = 0
+        self._on_blocks_done = on_done
+        self._state = self._read_sub_blocks
+
+    def _read_sub_blocks(self) -> bool:
+        buf = self._buf
+        end = len(buf)
+        pos = self._pos
+        chunks = self._chunks
+        count = self._sub_block_count
+        while pos < end:
+            block_size = buf[pos]
+            if block_size == 0:
+                self._sub_block_count = count
+                self._pos = pos + 1
+                self._state = self._read_block
+                if self._on_blocks_done is not None:
+                    self._on_blocks_done()
+                return True
+            if chunks is not None:
+                if pos + 1 + block_size > end:
+                    break
+                chunks.append(bytes(buf[pos + 1:pos + 1 + block_size]))
+            pos += 1 + block_size
+            count += 1
+        self._sub_block_count = count
+        self._pos = pos
+        return False
+
+    def _finish_frame(self) -> None:
+        (descriptor_offset, color_table_offset, data_offset, left, top, width, height, packed,
+         min_code_size) = self._frame
+        gce_offset, control_flags, delay, transparent_index = self._control
+        count = self._sub_block_count
+        record = FrameRecord(gce_offset, descriptor_offset, color_table_offset, data_offset, self.offset,
+                             left, top, width, height, packed, control_flags, delay, transparent_index,
+                             self.offset - data_offset - 2 - count, count, min_code_size)
+        self.frame_index.append(*record)
+        self._events.append(('frame', self.frame_count, record))
+        self.frame_count += 1
+        self._control = NO_CONTROL
+        self._frame = None
+
+    def _finish_graphics_control(self) -> None:
+        data = self._chunks[0] if self._chunks else b''
+        if len(data) < 4:
+            return
+        delay = data[1] | data[2] << 8
+        self._control = (self._block_offset, data[0], delay, data[3])
+        self.total_duration += delay * 10
+
+    def _finish_application(self) -> None:
+        if len(self._chunks) < 2 or not self._chunks[0].startswith(b'NETSCAPE2.0'):
+            return
+        data = self._chunks[1]
+        if len(data) == 3 and data[0] == 1:
+            self.loop_count = data[1] | data[2] << 8
+            self._events.append(('loop_count', self.loop_count))
+
+    def _finish_comment(self) -> None:
+        comment = b''.join(self._chunks).decode('ascii', errors='ignore')
+        if comment:
+            self.comments.append(comment)
+            self._events.append(('comment', comment))
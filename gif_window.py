@@ -0,0 +1,435 @@
+import os
+import customtkinter as ctk
+from collections import OrderedDict
+from tkinter import filedialog
+import tkinter as tk
+from PIL import Image, ImageTk
+from gif_analyzer import draw_checkerboard
+from gif_playback import DEFAULT_DELAY_MS, PlaybackScheduler
+from pathlib import Path
+
+
+class GifAnalyzer(ctk.CTk):
+    def __init__(self):
+        super().__init__()
+        self.title("GIF Analyzer with Pillow Checkerboard")
+        self.geometry("800x600")
+        self.resizable(False, False)
+
+        self.main_frame = ctk.CTkFrame(self)
+        self.main_frame.pack(fill="both", expand=True, padx=10, pady=10)
+
+        self.top_frame = ctk.CTkFrame(self.main_frame)
+        self.top_frame.pack(fill="x", padx=5, pady=5)
+
+        self.select_button = ctk.CTkButton(
+            self.top_frame,
+            text="Select GIF File",
+            command=self.open_file
+        )
+        self.select_button.pack(side="left", padx=5)
+
+        self.zoom_frame = ctk.CTkFrame(self.top_frame)
+        self.zoom_frame.pack(side="right", padx=5)
+
+        self.zoom_out_btn = ctk.CTkButton(
+            self.zoom_frame,
+            text="-",
+            width=30,
+            command=self.zoom_out
+        )
+        self.zoom_out_btn.pack(side="left", padx=2)
+
+        self.zoom_in_btn = ctk.CTkButton(
+            self.zoom_frame,
+            text="+",
+            width=30,
+            command=self.zoom_in
+        )
+        self.zoom_in_btn.pack(side="left", padx=2)
+
+        self.reset_zoom_btn = ctk.CTkButton(
+            self.zoom_frame,
+            text="Reset",
+            width=60,
+            command=self.reset_zoom
+        )
+        self.reset_zoom_btn.pack(side="left", padx=2)
+
+        self.playback_frame = ctk.CTkFrame(self.main_frame)
+        self.playback_frame.pack(fill="x", padx=5, pady=5)
+
+        self.controls_left = ctk.CTkFrame(self.playback_frame)
+        self.controls_left.pack(side="left", padx=5)
+
+        self.prev_frame_btn = ctk.CTkButton(
+            self.controls_left,
+            text="\u25C1",
+            width=30,
+            command=self.prev_frame
+        )
+        self.prev_frame_btn.pack(side="left", padx=2)
+
+        self.play_pause_btn = ctk.CTkButton(
+            self.controls_left,
+            text="PLAY",
+            width=50,
+            command=self.toggle_animation
+        )
+        self.play_pause_btn.pack(side="left", padx=2)
+
+        self.next_frame_btn = ctk.CTkButton(
+            self.controls_left,
+            text="\u25B7",
+            width=30,
+            command=self.next_frame
+        )
+        self.next_frame_btn.pack(side="left", padx=2)
+
+        self.frame_label = ctk.CTkLabel(self.controls_left, text="Frame: 0/0")
+        self.frame_label.pack(side="left", padx=5)
+
+        self.controls_right = ctk.CTkFrame(self.playback_frame)
+        self.controls_right.pack(side="right", padx=5)
+
+        self.status_label = ctk.CTkLabel(self.controls_right, text="")
+        self.status_label.pack(side="left", padx=5)
+
+        self.speed_label = ctk.CTkLabel(self.controls_right, text="Speed:")
+        self.speed_label.pack(side="left", padx=2)
+
+        self.speed_options = ["0.25x", "0.5x", "1x", "2x", "4x"]
+        self.speed_var = tk.StringVar(value="1x")
+        self.speed_menu = ctk.CTkOptionMenu(
+            self.controls_right,
+            values=self.speed_options,
+            variable=self.speed_var,
+            width=70,
+            command=self.change_speed
+        )
+        self.speed_menu.pack(side="left", padx=2)
+
+        self.canvas = tk.Canvas(self.main_frame, width=400, height=300, bg="white", highlightthickness=0)
+        self.canvas.pack(pady=10, fill="both", expand=True)
+
+        self.info_text = ctk.CTkTextbox(self.main_frame, height=200)
+        self.info_text.pack(fill="x", padx=5, pady=(5, 0))
+
+        self.copy_frame = ctk.CTkFrame(self.main_frame)
+        self.copy_frame.pack(fill="x", padx=5, pady=(2, 5))
+
+        self.copy_button = ctk.CTkButton(
+            self.copy_frame,
+            text="Copy Result",
+            width=100,
+            command=self.copy_result
+        )
+        self.copy_button.pack(side="right", padx=5)
+
+        self.save_button = ctk.CTkButton(
+            self.copy_frame,
+            text="Save As",
+            width=100,
+            command=self.save_result
+        )
+        self.save_button.pack(side="right", padx=5)
+
+        self.frames = []
+        self.photo_frames = []
+        self.current_frame_index = 0
+        self.total_frames = 0
+        self.playback_speed = 1.0
+        self.frame_delays = []
+        self.scheduler = None
+        self.animation_job = None
+        self.animation_running = False
+        self.current_file = None
+        self.frame_cache_budget = None
+        self.decode_workers = os.cpu_count() or 1
+        self.loader = None
+        self.loader_poll_ms = 30
+        self.frames_ready = 0
+
+        self.zoom_factor = 1
+        self.max_zoom = 8
+        self.min_zoom = 1
+        self.display_cache = OrderedDict()
+        self.display_cache_size = 16
+
+        self.canvas.bind("<Configure>", self.on_canvas_resize)
+
+    def on_canvas_resize(self, event):
+        self.display_cache.clear()
+        self.update_current_frame()
+
+    def draw_checkerboard_with_pillow(self, frame_image, cell_size=20, zoom=1):
+        return draw_checkerboard(frame_image, cell_size, zoom)
+
+    def render_frame(self, canvas):
+        return Image.fromarray(canvas.copy(), "RGBA")
+
+    def display_image(self, index):
+        key = (index, self.zoom_factor)
+        image = self.display_cache.get(key)
+        if image is None:
+            frame_image = self.frames[index]
+            box = self.visible_region(frame_image.size)
+            if box != (0, 0) + frame_image.size:
+                frame_image = frame_image.crop(box)
+            image = self.draw_checkerboard_with_pillow(frame_image, zoom=self.zoom_factor)
+            self.display_cache[key] = image
+            if len(self.display_cache) > self.display_cache_size:
+                self.display_cache.popitem(last=False)
+        else:
+            self.display_cache.move_to_end(key)
+        return image
+
+    def visible_region(self, size):
+        width, height = size
+        visible_width = min(width, -(-max(self.canvas.winfo_width(), 1) // self.zoom_factor))
+        visible_height = min(height, -(-max(self.canvas.winfo_height(), 1) // self.zoom_factor))
+        left = (width - visible_width) // 2
+        top = (height - visible_height) // 2
+        return left, top, left + visible_width, top + visible_height
+
+    def update_frame_counter(self):
+        self.frame_label.configure(text=f"Frame: {self.current_frame_index + 1}/{self.total_frames}")
+
+    def update_loading_status(self):
+        if self.loader is not None and self.total_frames:
+            self.status_label.configure(text=f"Loading {self.frames_ready}/{self.total_frames}")
+        elif self.loader is not None:
+            self.status_label.configure(text="Loading...")
+        else:
+            self.status_label.configure(text="")
+
+    def playable_frames(self):
+        return self.frames_ready if self.loader is not None else self.total_frames
+
+    def prev_frame(self):
+        if not self.frames or not self.playable_frames():
+            return
+        self.stop_animation()
+        self.current_frame_index = (self.current_frame_index - 1) % self.playable_frames()
+        self.update_current_frame()
+
+    def next_frame(self):
+        if not self.frames or not self.playable_frames():
+            return
+        self.stop_animation()
+        self.current_frame_index = (self.current_frame_index + 1) % self.playable_frames()
+        self.update_current_frame()
+
+    def toggle_animation(self):
+        if not self.frames:
+            return
+        if self.animation_running:
+            self.stop_animation()
+            self.play_pause_btn.configure(text="PLAY")
+        else:
+            self.start_animation()
+            self.play_pause_btn.configure(text="STOP")
+
+    def stop_animation(self):
+        self.animation_running = False
+        if self.animation_job is not None:
+            self.after_cancel(self.animation_job)
+            self.animation_job = None
+
+    def start_animation(self):
+        self.stop_animation()
+        self.animation_running = True
+        self.play_pause_btn.configure(text="STOP")
+
+        delays = self.frame_delays or [DEFAULT_DELAY_MS] * len(self.frames)
+        self.scheduler = PlaybackScheduler(delays, self.playback_speed)
+        self.scheduler.start(self.current_frame_index % len(delays))
+        self.animation_job = self.after(self.scheduler.wait_ms(), self.animate_gif)
+
+    def animate_gif(self):
+        self.animation_job = None
+        if not self.animation_running or not self.frames or not self.playable_frames():
+            return
+        self.current_frame_index = self.scheduler.advance(self.playable_frames())
+        self.update_current_frame()
+        if self.loader is None:
+            self.status_label.configure(
+                text=f"{self.scheduler.achieved_fps():.1f}/{self.scheduler.intended_fps():.1f} FPS")
+        self.animation_job = self.after(self.scheduler.wait_ms(), self.animate_gif)
+
+    def update_current_frame(self):
+        if self.frames:
+            self.canvas.delete("gif")
+
+            frame_image = self.display_image(self.current_frame_index)
+
+            self.checkerboard_image = ImageTk.PhotoImage(frame_image)
+
+            w = self.canvas.winfo_width() // 2
+            h = self.canvas.winfo_height() // 2
+            self.canvas.create_image(w, h, image=self.checkerboard_image, anchor="center", tags="gif")
+            self.update_frame_counter()
+
+    def change_speed(self, value):
+        speed_multiplier = {
+            "0.25x": 0.25,
+            "0.5x": 0.5,
+            "1x": 1.0,
+            "2x": 2.0,
+            "4x": 4.0
+        }
+        self.playback_speed = speed_multiplier[value]
+        if self.scheduler is not None:
+            self.scheduler.set_speed(self.playback_speed)
+
+    def zoom_in(self):
+        if self.zoom_factor < self.max_zoom:
+            self.zoom_factor *= 2
+            self.update_current_frame()
+
+    def zoom_out(self):
+        if self.zoom_factor > self.min_zoom:
+            self.zoom_factor //= 2
+            self.update_current_frame()
+
+    def reset_zoom(self):
+        if not self.frames:
+            return
+        self.zoom_factor = 1
+        self.update_current_frame()
+
+    def open_file(self):
+        file_path = filedialog.askopenfilename(filetypes=[("GIF files", "*.gif")])
+        if file_path:
+            self.load_gif(file_path)
+
+    def load_gif(self, file_path):
+        self.stop_animation()
+        self.play_pause_btn.configure(text="PLAY")
+        if self.loader is not None:
+            self.loader.cancel()
+        self.frames = []
+        self.photo_frames = []
+        self.current_frame_index = 0
+        self.total_frames = 0
+        self.frames_ready = 0
+        self.frame_delays = []
+        self.scheduler = None
+        self.current_file = file_path
+        self.gif_info = None
+        self.zoom_factor = 1
+        self.display_cache.clear()
+        self.update_frame_counter()
+
+        from gif_loader import GifLoader
+
+        self.loader = GifLoader(Path(file_path), self.frame_cache_budget, render=self.render_frame,
+                                workers=self.decode_workers)
+        self.loader.start()
+        self.update_loading_status()
+        self.after(self.loader_poll_ms, self.poll_loader, self.loader)
+
+    def poll_loader(self, loader):
+        if loader is not self.loader:
+            return
+
+        for event in loader.drain():
+            kind = event[0]
+            if kind == 'parsed':
+                _, self.gif_info, self.frames = event
+                self.total_frames = len(self.frames)
+                self.frame_delays = self.frames.compositor.frame_index.delays_ms()
+                self.update_frame_counter()
+                self.analyze_current_file()
+            elif kind == 'progress':
+                first_frame = self.frames_ready == 0
+                self.frames_ready = event[1]
+                if first_frame:
+                    self.update_current_frame()
+            elif kind == 'done':
+                self.loader = None
+            elif kind == 'error':
+                print(f"Error loading GIF: {event[1]}")
+                self.loader = None
+
+        self.update_loading_status()
+        if self.loader is loader:
+            self.after(self.loader_poll_ms, self.poll_loader, loader)
+
+    def analyze_current_file(self):
+        if not getattr(self, 'gif_info', None):
+            print("No file loaded to analyze")
+            return
+
+        try:
+            self.info_text.configure(state="normal")
+            self.info_text.delete("1.0", "end")
+
+            self.info_text.insert("end", "=== GIF Information ===\n")
+            self.info_text.insert("end", self.format_table(self.gif_info['headers']))
+
+            self.info_text.insert("end", "\n\n=== Frame Information ===")
+            for i, frame in enumerate(self.gif_info['frames']):
+                self.info_text.insert("end", f"\nFrame {i + 1}:")
+                for key, value in frame.items():
+                    self.info_text.insert("end", f"\n{key}: {value}")
+
+            self.info_text.configure(state="disabled")
+
+        except Exception as e:
+            print(f"Error analyzing GIF: {str(e)}")
+
+    def get_formatted_result(self):
+        if not getattr(self, 'gif_info', None):
+            return ""
+
+        text = []
+
+        text.append("=== GIF Information ===")
+        for section, items in self.gif_info['headers'].items():
+            text.append(f"\n{section}:")
+            for key, (value, description) in items.items():
+                text.append(f"{key}: {value} ({description})")
+
+        text.append("\n=== Frame Information ===")
+        for i, frame in enumerate(self.gif_info['frames'], 1):
+            text.append(f"\nFrame {i}:")
+            for key, value in frame.items():
+                text.append(f"{key}: {value}")
+
+        return "\n".join(text)
+
+    def format_table(self, data):
+        result = []
+        for section, items in data.items():
+            result.append(f"{section}:")
+            for key, (value, description) in items.items():
+                result.append(f"{key}: {value} ({description})")
+        return "\n".join(result)
+
+    def copy_result(self):
+        result = self.get_formatted_result()
+        if result:
+            self.clipboard_clear()
+            self.clipboard_append(result)
+
+    def save_result(self):
+        result = self.get_formatted_result()
+        if not result.strip():
+            return
+
+        default_name = "analysis.txt"
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".txt",
+            filetypes=[("Text files", "*.txt")],
+            initialfile=default_name
+        )
+        if file_path:
+            try:
+                with open(file_path, "w", encoding="utf-8") as f:
+                    f.write(result)
+            except Exception as e:
+                print(f"Error saving file: {str(e)}")
+
+    def run(self):
+        self.mainloop()
@@ -1,8 +1,11 @@
-from PIL import Image
+from pathlib import Path
 
 import pytest
 from unittest.mock import MagicMock, patch
-from gif_analyzer import GifAnalyzer
+from PIL import Image
+from gif_analyzer import GifAnalyzer, checkerboard_image, draw_checkerboard
+
+TEST_GIFS = Path(__file__).parent.parent / "test_gifs"
 
 
 @pytest.fixture
@@ -41,15 +44,14 @@ def test_load_gif(mock_gif_parser):
     app = GifAnalyzer()
 
     app.canvas = MagicMock()
+    app.canvas.winfo_width.return_value = 400
+    app.canvas.winfo_height.return_value = 300
 
-    mock_image = Image.new("RGBA", (16, 16), (255, 0, 0, 255))  # A red 16x16 image
-    mock_sequence = [mock_image]
-
-    with patch('PIL.Image.open', return_value=mock_image), \
-         patch('PIL.ImageSequence.Iterator', return_value=mock_sequence), \
-         patch('PIL.ImageTk.PhotoImage', return_value=MagicMock()):
-
-        app.load_gif("/path/to/test.gif")
+    with patch('PIL.ImageTk.PhotoImage', return_value=MagicMock()):
+        app.load_gif(str(TEST_GIFS / "1x1.gif"))
+        loader = app.loader
+        loader.join()
+        app.poll_loader(loader)
 
     assert len(app.frames) == 1
     assert app.total_frames == 1
@@ -81,14 +83,33 @@ def test_toggle_animation():
 def test_zoom_in(monkeypatch):
     app = GifAnalyzer()
     app.frames = [MagicMock()]
-    app.reload_frames = MagicMock()
+    app.update_current_frame = MagicMock()
+    app.load_gif = MagicMock()
 
     app.zoom_factor = 1
     app.max_zoom = 8
 
     app.zoom_in()
     assert app.zoom_factor == 2
-    app.reload_frames.assert_called_once()
+    app.update_current_frame.assert_called_once()
+    app.load_gif.assert_not_called()
+
+
+def test_zoomed_frames_are_scaled_and_cached():
+    app = GifAnalyzer()
+    app.canvas = MagicMock()
+    app.canvas.winfo_width.return_value = 400
+    app.canvas.winfo_height.return_value = 300
+    app.frames = [Image.new("RGBA", (10, 5), (255, 0, 0, 255)), Image.new("RGBA", (1000, 10))]
+
+    app.zoom_factor = 4
+    zoomed = app.display_image(0)
+
+    assert zoomed.size == (40, 20)
+    assert app.display_image(0) is zoomed
+    assert app.display_image(1).size == (400, 40)
+    app.zoom_factor = 1
+    assert app.display_image(0).size == (10, 5)
 
 
 def test_copy_result(monkeypatch):
@@ -120,3 +141,25 @@ def test_save_result(monkeypatch):
         app.save_result()
 
     mocked_file.assert_called_once_with(test_file_path, "w", encoding="utf-8")
+
+
+def test_checkerboard_is_built_once_per_size():
+    board = checkerboard_image((50, 30), 20)
+
+    assert board is checkerboard_image((50, 30), 20)
+    assert board.size == (50, 30)
+    assert board.getpixel((0, 0)) == (192, 192, 192, 255)
+    assert board.getpixel((20, 0)) == (255, 255, 255, 0)
+    assert board.getpixel((45, 25)) == (255, 255, 255, 0)
+    assert checkerboard_image((50, 30), 20, 2).size == (100, 60)
+
+
+def test_draw_checkerboard_composites_frame():
+    frame = Image.new("RGBA", (30, 30), (0, 0, 0, 0))
+    frame.putpixel((1, 1), (255, 0, 0, 255))
+
+    result = draw_checkerboard(frame, zoom=2)
+
+    assert result.size == (60, 60)
+    assert result.getpixel((3, 3)) == (255, 0, 0, 255)
+    assert result.getpixel((0, 0)) == (192, 192, 192, 255)
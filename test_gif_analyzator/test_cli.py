@@ -3,8 +3,12 @@ from unittest.mock import MagicMock
 from pathlib import Path
 import sys
 import io
+import json
 
-from cli import main
+from cli import analyze_path, main
+
+
+TEST_GIFS = Path(__file__).parent.parent / "test_gifs"
 
 
 @pytest.fixture
@@ -58,4 +62,152 @@ def test_main_with_stdout(monkeypatch, capsys, mock_gif_parser):
     captured = capsys.readouterr()
     assert "=== GIF Information ===" in captured.out
     assert "Frame 1:" in captured.out
-    assert "Position: (0, 0)" in captured.out
\ No newline at end of file
+    assert "Position: (0, 0)" in captured.out
+
+
+def test_batch_directory_with_workers(monkeypatch, capsys):
+    monkeypatch.setattr(sys, 'argv', ["script_name", "--batch", str(TEST_GIFS), "-j", "2", "--chunksize", "1"])
+
+    main()
+
+    captured = capsys.readouterr()
+    lines = sorted(captured.out.splitlines())
+    expected = sorted(TEST_GIFS.glob('*.gif'))
+    assert len(lines) == len(expected)
+    assert any(line.startswith(str(TEST_GIFS / "20fps.gif")) and "66 frames" in line for line in lines)
+    assert f"Analyzed {len(expected)} files, 0 errors" in captured.err
+
+
+def test_batch_reports_errors_per_file(monkeypatch, capsys, tmp_path):
+    bad = tmp_path / "bad.gif"
+    bad.write_bytes(b"junk")
+    monkeypatch.setattr(sys, 'argv', ["script_name", "--batch", str(bad), str(TEST_GIFS / "1x1.gif"), "-j", "1"])
+
+    main()
+
+    captured = capsys.readouterr()
+    assert f"{bad}: Error:" in captured.out
+    assert "1x1, 1 frames" in captured.out
+    assert "Analyzed 2 files, 1 errors" in captured.err
+
+
+def test_batch_reads_paths_from_stdin(monkeypatch, capsys):
+    monkeypatch.setattr(sys, 'argv', ["script_name", "--from-stdin", "-j", "1"])
+    monkeypatch.setattr(sys, 'stdin', io.StringIO(f"{TEST_GIFS / 'transparent.gif'}\n\nmissing.gif\n"))
+
+    main()
+
+    captured = capsys.readouterr()
+    assert "transparent.gif: 108x112, 2 frames" in captured.out
+    assert "missing.gif: Error: File missing.gif not found" in captured.out
+
+
+def test_jsonl_format_writes_typed_records(monkeypatch, capsys):
+    monkeypatch.setattr(sys, 'argv', ["script_name", str(TEST_GIFS / "transparent.gif"), "--format", "jsonl"])
+
+    main()
+
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert records[0]['type'] == 'file'
+    assert records[0]['width'] == 108
+    assert [record['delay_ms'] for record in records[1:]] == [100, 100]
+
+
+def test_reads_gif_from_stdin(monkeypatch, capsys):
+    data = (TEST_GIFS / "transparent.gif").read_bytes()
+    monkeypatch.setattr(sys, 'stdin', io.TextIOWrapper(io.BytesIO(data)))
+    monkeypatch.setattr(sys, 'argv', ["script_name", "-", "--format", "jsonl"])
+
+    main()
+
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert records[0]['path'] == '-'
+    assert records[0]['file_size'] == len(data)
+    assert [record['delay_ms'] for record in records[1:]] == [100, 100]
+
+
+def test_text_output_lists_heaviest_frames(monkeypatch, capsys):
+    monkeypatch.setattr(sys, 'argv', ["script_name", str(TEST_GIFS / "20fps.gif"), "--heaviest", "3"])
+
+    main()
+
+    section = capsys.readouterr().out.split("=== Heaviest Frames ===\n")[1]
+    lines = section.splitlines()
+    assert len(lines) == 3
+    assert all("bytes/pixel" in line for line in lines)
+
+
+def test_batch_jsonl_reports_errors_as_records(monkeypatch, capsys, tmp_path):
+    output = tmp_path / "out.jsonl"
+    monkeypatch.setattr(sys, 'argv', ["script_name", "--batch", str(TEST_GIFS / "1x1.gif"), "missing.gif",
+                                      "-j", "1", "--format", "jsonl", "-o", str(output)])
+
+    main()
+
+    records = [json.loads(line) for line in output.read_text(encoding='utf-8').splitlines()]
+    assert [record['type'] for record in records] == ['file', 'frame', 'error']
+    assert records[2]['path'] == "missing.gif"
+
+
+def test_batch_workers_send_frame_index_not_records(monkeypatch, capsys, tmp_path):
+    output = tmp_path / "out.jsonl"
+    monkeypatch.setattr(sys, 'argv', ["script_name", "--batch", str(TEST_GIFS / "20fps.gif"),
+                                      "-j", "2", "--format", "jsonl", "-o", str(output)])
+    result = analyze_path(TEST_GIFS / "20fps.gif", 'jsonl')
+
+    main()
+
+    records = [json.loads(line) for line in output.read_text(encoding='utf-8').splitlines()]
+    assert 'records' not in result
+    assert len(records) == 1 + len(result['frame_index'])
+    assert records[0] == result['file']
+    assert [record['delay_ms'] for record in records[1:]] == result['frame_index'].delays_ms()
+
+
+@pytest.mark.parametrize("mode", [[], ["--batch"]])
+def test_jsonl_output_stays_clean_for_truncated_files(monkeypatch, capsys, tmp_path, mode):
+    truncated = tmp_path / "truncated.gif"
+    truncated.write_bytes((TEST_GIFS / "20fps.gif").read_bytes()[:1480])
+    monkeypatch.setattr(sys, 'argv', ["script_name", *mode, str(truncated), "-j", "1", "--format", "jsonl"])
+
+    main()
+
+    captured = capsys.readouterr()
+    records = [json.loads(line) for line in captured.out.splitlines()]
+    assert records[0]['type'] == 'file'
+    assert "Error parsing frame" in captured.err
+
+
+def test_batch_reports_limit_errors(monkeypatch, capsys):
+    monkeypatch.setattr(sys, 'argv', ["script_name", "--batch", str(TEST_GIFS / "transparent.gif"),
+                                      "-j", "1", "--max-frames", "1"])
+
+    main()
+
+    captured = capsys.readouterr()
+    assert "transparent.gif: Error: Limit max_frames exceeded: 2 > 1" in captured.out
+    assert "Analyzed 1 files, 1 errors" in captured.err
+
+
+def test_batch_reports_cache_counters(monkeypatch, capsys, tmp_path):
+    args = ["script_name", "--batch", str(TEST_GIFS), "-j", "1", "--cache", str(tmp_path / "cache.db")]
+    monkeypatch.setattr(sys, 'argv', args)
+    count = len(list(TEST_GIFS.glob('*.gif')))
+
+    main()
+    assert f"Cache: 0 hits, {count} misses" in capsys.readouterr().err
+
+    main()
+    assert f"Cache: {count} hits, 0 misses" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("module", ["cli", "gif_analyzer"])
+def test_import_stays_headless(module):
+    import subprocess
+
+    from benchmarks.bench_import import heavy_imports
+
+    code = f"import sys, {module}; print('\\n'.join(sys.modules))"
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True,
+                            cwd=Path(__file__).parent.parent)
+    assert heavy_imports(dict.fromkeys(result.stdout.split(), 0)) == []
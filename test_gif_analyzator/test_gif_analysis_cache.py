@@ -0,0 +1,112 @@
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from gif_analysis_cache import AnalysisCache
+from gif_parser import GifParser
+
+
+TEST_GIFS = Path(__file__).parent.parent / "test_gifs"
+
+
+@pytest.fixture
+def gif_copy(tmp_path):
+    path = tmp_path / "transparent.gif"
+    shutil.copy(TEST_GIFS / "transparent.gif", path)
+    return path
+
+
+@pytest.fixture
+def cache(tmp_path):
+    with AnalysisCache(tmp_path / "cache.db") as cache:
+        yield cache
+
+
+def touch_later(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+
+def test_parser_reuses_cached_analysis(gif_copy, cache):
+    first = GifParser(gif_copy, cache=cache)
+    info = first.parse_file()
+    assert not first.from_cache
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    second = GifParser(gif_copy, cache=cache)
+    assert second.parse_file() == info
+    assert second.from_cache
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert second.frame_index.delays_ms() == first.frame_index.delays_ms()
+    assert second.global_color_table_flag and second.global_color_table == first.global_color_table
+
+
+def test_modified_file_is_reanalyzed(gif_copy, cache):
+    GifParser(gif_copy, cache=cache).parse_file()
+    gif_copy.write_bytes((TEST_GIFS / "1x1.gif").read_bytes())
+
+    parser = GifParser(gif_copy, cache=cache)
+    info = parser.parse_file()
+    assert not parser.from_cache
+    assert info['dimensions'] == (1, 1)
+
+
+def test_touched_file_is_reanalyzed_without_hash(gif_copy, cache):
+    GifParser(gif_copy, cache=cache).parse_file()
+    touch_later(gif_copy)
+
+    assert cache.get(gif_copy) is None
+
+
+def test_content_hash_keeps_touched_file_cached(gif_copy, tmp_path):
+    with AnalysisCache(tmp_path / "hashed.db", use_hash=True) as cache:
+        GifParser(gif_copy, cache=cache).parse_file()
+        touch_later(gif_copy)
+
+        parser = GifParser(gif_copy, cache=cache)
+        parser.parse_file()
+        assert parser.from_cache
+
+
+def test_cache_persists_between_connections(gif_copy, tmp_path):
+    with AnalysisCache(tmp_path / "cache.db") as cache:
+        GifParser(gif_copy, cache=cache).parse_file()
+    with AnalysisCache(tmp_path / "cache.db") as cache:
+        assert cache.get(gif_copy) is not None
+
+
+def test_pickled_state_is_never_loaded(gif_copy, cache, monkeypatch):
+    import pickle
+
+    GifParser(gif_copy, cache=cache).parse_file()
+    cache._conn.execute("UPDATE analysis SET state = ?", (pickle.dumps({'frame_count': 2}),))
+    monkeypatch.setattr(pickle, "loads", lambda *args: pytest.fail("cached state was unpickled"))
+
+    assert cache.get(gif_copy) is None
+    parser = GifParser(gif_copy, cache=cache)
+    assert parser.parse_file()['frame_count'] == 2
+    assert not parser.from_cache
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    paths = []
+    for name in ("a.gif", "b.gif", "c.gif"):
+        path = tmp_path / name
+        shutil.copy(TEST_GIFS / "transparent.gif", path)
+        paths.append(path)
+
+    with AnalysisCache(tmp_path / "cache.db") as cache:
+        GifParser(paths[0], cache=cache).parse_file()
+        entry_size = cache.total_bytes()
+        cache.max_bytes = 2 * entry_size
+
+        GifParser(paths[1], cache=cache).parse_file()
+        assert cache.get(paths[0]) is not None
+        GifParser(paths[2], cache=cache).parse_file()
+
+        assert len(cache) == 2
+        assert cache.total_bytes() <= cache.max_bytes
+        assert cache.get(paths[1]) is None
+        assert cache.get(paths[0]) is not None
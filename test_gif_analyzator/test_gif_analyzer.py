@@ -1,7 +1,15 @@
+import io
+import os
+import threading
+import time
+
 import pytest
 from unittest.mock import MagicMock, mock_open
 from pathlib import Path
-from gif_parser import GifParser
+from benchmarks.gif_factory import make_gif
+from gif_parser import GifLimitExceeded, GifParser, ParseLimits
+
+TEST_GIFS = Path(__file__).parent.parent / "test_gifs"
 
 
 @pytest.fixture
@@ -48,35 +56,20 @@ def test_parse_file(mock_file_path, gif_binary_data, monkeypatch):
     assert info["headers"]["Logical Screen Descriptor"]["Canvas Size"] == ("16x16", "Image dimensions")
 
 
-def test_parse_header(mock_file_path, gif_binary_data, monkeypatch):
-    mock_open_func = mock_open(read_data=gif_binary_data)
-    monkeypatch.setattr("builtins.open", mock_open_func)
-    monkeypatch.setattr(Path, "open", mock_open_func)
-
-    monkeypatch.setattr(Path, "exists", lambda x: True)
-
+def test_parse_header(mock_file_path, gif_binary_data):
     parser = GifParser(mock_file_path)
 
-    with mock_open_func(mock_file_path.open("rb")) as f:
-        parser._parse_header(f)
+    assert parser._parse_header(memoryview(gif_binary_data), 0) == 6
 
     headers = parser.headers_info["Header"]
     assert headers["Signature"] == ("GIF", "GIF signature")
     assert headers["Version"] == ("89a", "GIF version")
 
 
-def test_logical_screen_descriptor(mock_file_path, gif_binary_data, monkeypatch):
-    mock_open_func = mock_open(read_data=gif_binary_data)
-    monkeypatch.setattr("builtins.open", mock_open_func)
-    monkeypatch.setattr(Path, "open", mock_open_func)
-
-    monkeypatch.setattr(Path, "exists", lambda x: True)
-
+def test_logical_screen_descriptor(mock_file_path, gif_binary_data):
     parser = GifParser(mock_file_path)
 
-    with mock_open_func(mock_file_path.open("rb")) as f:
-        f.read(6)
-        parser._parse_logical_screen_descriptor(f)
+    assert parser._parse_logical_screen_descriptor(memoryview(gif_binary_data), 6) == 13
 
     descriptor = parser.headers_info["Logical Screen Descriptor"]
     assert descriptor["Canvas Size"] == ("16x16", "Image dimensions")
@@ -85,27 +78,19 @@ def test_logical_screen_descriptor(mock_file_path, gif_binary_data, monkeypatch)
     assert descriptor["Color Table Size"] == (256, "Number of entries in global color table")
 
 
-def test_frame_parsing(mock_file_path, gif_binary_data, monkeypatch):
-    mock_open_func = mock_open(read_data=gif_binary_data)
-    monkeypatch.setattr("builtins.open", mock_open_func)
-    monkeypatch.setattr(Path, "open", mock_open_func)
-
-    monkeypatch.setattr(Path, "exists", lambda x: True)
-
+def test_frame_parsing(mock_file_path, gif_binary_data):
     parser = GifParser(mock_file_path)
 
-    with mock_open_func(mock_file_path.open("rb")) as f:
-        f.read(6)
-        f.read(7)
-        f.read(3 * 256)
-        parser._parse_frames(f)
+    parser._parse_frames(memoryview(gif_binary_data), 6 + 7 + 3 * 256)
 
     assert parser.frame_count == 1
     assert len(parser.frames_info) == 1
     assert "Position" in parser.frames_info[0]
     assert parser.frames_info[0]["Size"] == "16x16"
+    assert parser.frames_info[0]["Delay"] == "0ms"
+
 
-def test_parse_application_extension(mock_file_path, monkeypatch):
+def test_parse_application_extension(mock_file_path):
     app_extension_data = (
         b"GIF89a"  
         b"\x10\x00\x10\x00"  
@@ -116,19 +101,245 @@ def test_parse_application_extension(mock_file_path, monkeypatch):
         b"\x21\xff\x0bNETSCAPE2.0\x03\x01\x00\x00\x00"
     )
 
-    mock_open_func = mock_open(read_data=app_extension_data)
-    monkeypatch.setattr("builtins.open", mock_open_func)
-    monkeypatch.setattr(Path, "open", mock_open_func)
-    monkeypatch.setattr(Path, "exists", lambda x: True)
-
     parser = GifParser(mock_file_path)
 
-    with mock_open_func(mock_file_path.open("rb")) as f:
-        f.read(6)
-        f.read(7)
-        f.read(3 * 256)
-        parser._parse_frames(f)
+    parser._parse_frames(memoryview(app_extension_data), 6 + 7 + 3 * 256)
 
     metadata = parser.headers_info.get("Metadata", {})
     assert "Loop Count" in metadata
     assert metadata["Loop Count"] == (0, "Number of animation iterations (0 = infinite)")
+
+
+def test_extensions_are_consumed_once():
+    info = GifParser(TEST_GIFS / "transparent.gif").parse_file()
+
+    assert info["frame_count"] == 2
+    assert info["frames"][0]["Position"] == (1, 5)
+    assert info["frames"][0]["Disposal Method"] == "Restore to background"
+    assert info["headers"]["Summary"]["Duration"] == ("200ms", "Total animation duration")
+
+
+def test_mmap_matches_buffered_read():
+    path = TEST_GIFS / "20fps.gif"
+    assert GifParser(path, use_mmap=True).parse_file() == GifParser(path).parse_file()
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="requires named pipes")
+def test_mmap_falls_back_to_stream_for_pipes(tmp_path):
+    fifo = tmp_path / "pipe.gif"
+    os.mkfifo(fifo)
+    writer = threading.Thread(target=fifo.write_bytes, args=((TEST_GIFS / "1x1.gif").read_bytes(),))
+    writer.start()
+
+    info = GifParser(fifo, use_mmap=True).parse_file()
+    writer.join()
+
+    assert info["dimensions"] == (1, 1)
+    assert info["frame_count"] == 1
+
+
+@pytest.mark.parametrize("name", ["1x1.gif", "20fps.gif", "transparent.gif"])
+def test_summary_level_matches_full_summary(name):
+    full = GifParser(TEST_GIFS / name).parse_file()
+    parser = GifParser(TEST_GIFS / name)
+    summary = parser.parse_file('summary')
+
+    assert summary['headers']['Summary'] == full['headers']['Summary']
+    assert summary['headers'].get('Metadata') == full['headers'].get('Metadata')
+    assert summary['frames'] == []
+    assert parser.global_color_table == []
+    assert len(parser.frame_index) == 0
+
+
+def test_lazy_index_after_summary_starts_fresh():
+    parser = GifParser(TEST_GIFS / "transparent.gif")
+    parser.parse_file('summary')
+    parser.get_frame_record(0)
+
+    assert parser.frame_count == 2
+    assert len(parser.frame_index) == 2
+    assert parser.total_duration == 200
+
+
+@pytest.mark.parametrize("wrap", [Path, Path.read_bytes])
+def test_parsing_twice_gives_the_same_result(wrap):
+    parser = GifParser(wrap(TEST_GIFS / "transparent.gif"))
+    first = parser.parse_file()
+
+    assert parser.parse_file() == first
+    assert len(parser.frame_index) == 2
+
+
+@pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview, io.BytesIO])
+def test_in_memory_sources_match_file(wrap):
+    path = TEST_GIFS / "transparent.gif"
+    parser = GifParser(wrap(path.read_bytes()))
+
+    assert parser.parse_file() == GifParser(path).parse_file()
+    assert parser.file_path is None
+    assert parser.file_size == path.stat().st_size
+
+
+def test_buffer_source_is_not_copied():
+    data = bytearray((TEST_GIFS / "20fps.gif").read_bytes())
+    parser = GifParser(data)
+    parser.parse_file()
+
+    assert parser.buffer.obj is data
+    assert parser.global_color_table[0] == tuple(data[13:16])
+
+
+def test_in_memory_sources_reject_sidecar_and_cache():
+    data = (TEST_GIFS / "1x1.gif").read_bytes()
+    with pytest.raises(ValueError):
+        GifParser(data, index_sidecar=True)
+    with pytest.raises(ValueError):
+        GifParser(io.BytesIO(data), cache=object())
+
+
+def test_header_level_stops_after_screen_descriptor():
+    parser = GifParser(TEST_GIFS / "20fps.gif")
+    info = parser.parse_file('header')
+
+    assert info['dimensions'] == (48, 48)
+    assert info['frame_count'] == 0
+    assert 'Logical Screen Descriptor' in info['headers']
+    assert 'Metadata' not in info['headers']
+
+
+def test_unknown_level_is_rejected():
+    with pytest.raises(ValueError):
+        GifParser(TEST_GIFS / "1x1.gif").parse_file('frames')
+
+
+def test_global_color_table_is_a_view_over_the_buffer():
+    np = pytest.importorskip("numpy")
+    parser = GifParser(TEST_GIFS / "transparent.gif")
+    parser.parse_file()
+
+    table = parser.color_table()
+    assert table.shape == (256, 3)
+    palette = np.asarray(table)
+    assert palette.dtype == np.uint8
+    assert np.shares_memory(palette, np.frombuffer(parser.buffer, dtype=np.uint8))
+    assert parser.global_color_table[0] == tuple(palette[0].tolist())
+    assert parser.local_color_table(0) is None
+    assert parser.color_table(0) == table
+
+
+def test_local_color_tables_are_captured_per_frame(tmp_path):
+    Image = pytest.importorskip("PIL.Image")
+    path = tmp_path / "local.gif"
+    frames = [Image.new('RGB', (4, 4), (i * 40, 255 - i * 40, 7)) for i in range(3)]
+    frames[0].save(path, save_all=True, append_images=frames[1:])
+
+    parser = GifParser(path)
+    parser.parse_file()
+    for n in range(1, 3):
+        table = parser.local_color_table(n)
+        assert table is not None
+        assert parser.color_table(n) == table
+        assert table.tolist()[0] == [n * 40, 255 - n * 40, 7]
+
+    mapped = GifParser(path, use_mmap=True)
+    mapped.parse_file()
+    assert mapped.buffer is None
+    assert mapped.local_color_table(2).tolist() == parser.local_color_table(2).tolist()
+
+
+@pytest.mark.parametrize("level", ["summary", "full"])
+def test_frame_limit_raises_with_partial_result(level):
+    parser = GifParser(TEST_GIFS / "transparent.gif", limits=ParseLimits(max_frames=1))
+    with pytest.raises(GifLimitExceeded) as excinfo:
+        parser.parse_file(level)
+
+    assert excinfo.value.limit == 'max_frames'
+    assert excinfo.value.partial['frame_count'] == 1
+    assert excinfo.value.partial['dimensions'] == (108, 112)
+    assert len(excinfo.value.partial['frames']) == (1 if level == 'full' else 0)
+
+
+@pytest.mark.parametrize("limits, name", [
+    (ParseLimits(max_canvas_pixels=100), 'max_canvas_pixels'),
+    (ParseLimits(max_frame_pixels=100), 'max_frame_pixels'),
+    (ParseLimits(max_seconds=0), 'max_seconds'),
+])
+def test_limits_are_enforced(limits, name):
+    with pytest.raises(GifLimitExceeded) as excinfo:
+        GifParser(TEST_GIFS / "20fps.gif", limits=limits).parse_file()
+    assert excinfo.value.limit == name
+
+
+@pytest.mark.parametrize("level", ["summary", "full"])
+def test_byte_limit_stops_reading(tmp_path, level):
+    path = tmp_path / "long.gif"
+    data = make_gif(16, 16, 100)
+    path.write_bytes(data)
+
+    parser = GifParser(path, limits=ParseLimits(max_bytes=len(data) // 2))
+    with pytest.raises(GifLimitExceeded) as excinfo:
+        parser.parse_file(level)
+
+    assert excinfo.value.limit == 'max_bytes'
+    assert 0 < excinfo.value.partial['frame_count'] < 100
+    assert len(parser.buffer) == len(data) // 2 + 1
+
+
+@pytest.mark.parametrize("level", ["summary", "full"])
+def test_byte_limit_inside_color_table(level):
+    with pytest.raises(GifLimitExceeded) as excinfo:
+        GifParser(TEST_GIFS / "20fps.gif", limits=ParseLimits(max_bytes=100)).parse_file(level)
+
+    assert excinfo.value.limit == 'max_bytes'
+    assert excinfo.value.partial['frame_count'] == 0
+
+
+def hostile_gif(sub_blocks):
+    image = b"\x2C" + bytes(4) + b"\x01\x00\x01\x00\x00\x02" + b"\x01\x00" * sub_blocks + b"\x00\x3B"
+    return b"GIF89a" + bytes([1, 0, 1, 0, 0, 0, 0]) + image
+
+
+@pytest.fixture(scope="module")
+def hostile_file(tmp_path_factory):
+    path = tmp_path_factory.mktemp("hostile") / "sub_blocks.gif"
+    path.write_bytes(hostile_gif(5_000_000))
+    return path
+
+
+@pytest.mark.parametrize("source", ["bytes", "mmap"])
+@pytest.mark.parametrize("level", ["summary", "full"])
+def test_limits_stop_inside_one_image(hostile_file, source, level):
+    def parser(limits):
+        if source == "bytes":
+            return GifParser(hostile_file.read_bytes(), limits=limits)
+        return GifParser(hostile_file, use_mmap=True, limits=limits)
+
+    started = time.perf_counter()
+    with pytest.raises(GifLimitExceeded) as excinfo:
+        parser(ParseLimits(max_seconds=0.01)).parse_file(level)
+    assert excinfo.value.limit == 'max_seconds'
+    assert time.perf_counter() - started < 0.2
+
+    capped = parser(ParseLimits(max_bytes=1000))
+    with pytest.raises(GifLimitExceeded) as excinfo:
+        capped.parse_file(level)
+    assert excinfo.value.limit == 'max_bytes'
+    assert excinfo.value.value == 1001
+
+
+@pytest.mark.parametrize("level", ["summary", "full"])
+def test_deadline_stops_inside_junk_bytes(level):
+    data = b"GIF89a" + bytes([1, 0, 1, 0, 0, 0, 0]) + bytes(5_000_000) + b"\x3B"
+
+    started = time.perf_counter()
+    with pytest.raises(GifLimitExceeded) as excinfo:
+        GifParser(data, limits=ParseLimits(max_seconds=0.01)).parse_file(level)
+    assert excinfo.value.limit == 'max_seconds'
+    assert time.perf_counter() - started < 0.2
+
+
+def test_limits_within_bounds_do_not_change_result():
+    path = TEST_GIFS / "20fps.gif"
+    limits = ParseLimits(max_frames=1000, max_canvas_pixels=48 * 48, max_bytes=path.stat().st_size,
+                         max_frame_pixels=48 * 48, max_seconds=60)
+    assert GifParser(path, limits=limits).parse_file() == GifParser(path).parse_file()
@@ -0,0 +1,72 @@
+import asyncio
+from pathlib import Path
+
+from gif_async import analyze_many, analyze_stream, iter_events
+
+
+TEST_GIFS = Path(__file__).parent.parent / "test_gifs"
+
+
+def stream_reader(data: bytes) -> asyncio.StreamReader:
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+async def slow_chunks(data: bytes, chunk_size: int, in_flight: list):
+    in_flight[0] += 1
+    in_flight[1] = max(in_flight[1], in_flight[0])
+    starts = range(0, len(data), chunk_size)
+    for start in starts:
+        await asyncio.sleep(0)
+        if start == starts[-1]:
+            in_flight[0] -= 1
+        yield data[start:start + chunk_size]
+
+
+def test_analyze_stream_reader():
+    async def run():
+        return await analyze_stream(stream_reader((TEST_GIFS / "20fps.gif").read_bytes()), chunk_size=100)
+
+    parser = asyncio.run(run())
+    assert parser.finished
+    assert parser.frame_count == 66
+    assert parser.total_duration == 3300
+
+
+def test_iter_events_allows_early_rejection():
+    data = (TEST_GIFS / "transparent.gif").read_bytes()
+
+    async def run():
+        async for event in iter_events(slow_chunks(data, 16, [0, 0])):
+            if event[0] == 'header':
+                return event[1]
+
+    assert asyncio.run(run())['width'] == 108
+
+
+def test_analyze_many_bounds_concurrency_and_keeps_order():
+    names = ["1x1.gif", "20fps.gif", "transparent.gif"] * 10
+    in_flight = [0, 0]
+
+    async def run():
+        sources = (slow_chunks((TEST_GIFS / name).read_bytes(), 256, in_flight) for name in names)
+        return await analyze_many(sources, concurrency=4)
+
+    results = asyncio.run(run())
+    assert [result.frame_count for result in results] == [{"1x1.gif": 1, "20fps.gif": 66,
+                                                            "transparent.gif": 2}[name] for name in names]
+    assert in_flight[1] == 4
+
+
+def test_analyze_many_returns_errors_in_place():
+    data = (TEST_GIFS / "1x1.gif").read_bytes()
+
+    async def run():
+        return await analyze_many([stream_reader(data), stream_reader(b"not a gif"), stream_reader(data[:20])])
+
+    ok, bad, truncated = asyncio.run(run())
+    assert ok.frame_count == 1
+    assert isinstance(bad, ValueError)
+    assert isinstance(truncated, ValueError)
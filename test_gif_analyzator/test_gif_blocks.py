@@ -0,0 +1,67 @@
+from pathlib import Path
+
+import pytest
+
+from benchmarks.gif_factory import make_gif
+from gif_blocks import (APPLICATION_LABEL, COMMENT_LABEL, PLAIN_TEXT_LABEL, ExtensionBlock, GraphicsControlBlock,
+                        HeaderBlock, ImageBlock, ScreenDescriptorBlock, TrailerBlock, iter_blocks)
+from gif_parser import GifParser
+
+
+TEST_GIFS = Path(__file__).parent.parent / "test_gifs"
+
+
+@pytest.mark.parametrize("name", ["1x1.gif", "20fps.gif", "transparent.gif"])
+def test_blocks_tile_the_file(name):
+    data = (TEST_GIFS / name).read_bytes()
+    blocks = list(iter_blocks(memoryview(data)))
+
+    assert isinstance(blocks[0], HeaderBlock)
+    assert isinstance(blocks[1], ScreenDescriptorBlock)
+    assert isinstance(blocks[-1], TrailerBlock)
+    pos = 0
+    for block in blocks:
+        assert block.offset == pos
+        pos += block.length
+    assert pos == len(data)
+
+
+def test_blocks_match_frame_index():
+    parser = GifParser(TEST_GIFS / "transparent.gif")
+    parser.parse_file()
+    images = [block for block in parser.iter_blocks() if isinstance(block, ImageBlock)]
+    controls = [block for block in parser.iter_blocks() if isinstance(block, GraphicsControlBlock)]
+
+    assert len(images) == len(parser.frame_index)
+    for n, (image, control) in enumerate(zip(images, controls)):
+        record = parser.get_frame_record(n)
+        assert (image.offset, image.data_offset, image.offset + image.length) == \
+               (record.descriptor_offset, record.data_offset, record.data_end)
+        assert (image.left, image.top, image.width, image.height) == \
+               (record.left, record.top, record.width, record.height)
+        assert (control.offset, control.delay) == (record.gce_offset, record.delay)
+
+
+def test_all_extensions_are_reported():
+    data = bytearray(make_gif(4, 4, 1, comment="hello", app_extensions=1))
+    plain_text = b"\x21\x01\x0c" + bytes(12) + b"\x02hi\x00"
+    data[-1:] = plain_text + b"\x3B"
+
+    extensions = [block for block in iter_blocks(memoryview(bytes(data))) if isinstance(block, ExtensionBlock)]
+    labels = [(block.label, block.identifier) for block in extensions]
+
+    assert labels == [(APPLICATION_LABEL, b"NETSCAPE2.0"), (APPLICATION_LABEL, b"BENCHAPP1.0"),
+                      (COMMENT_LABEL, b""), (PLAIN_TEXT_LABEL, b"")]
+    comment = extensions[2]
+    assert bytes(data[comment.data_offset + 1:comment.data_offset + 6]) == b"hello"
+
+
+def test_iteration_can_stop_early(tmp_path):
+    path = tmp_path / "many.gif"
+    path.write_bytes(make_gif(8, 8, 50))
+
+    blocks = GifParser(path).iter_blocks()
+    first_image = next(block for block in blocks if isinstance(block, ImageBlock))
+    blocks.close()
+
+    assert first_image.width == 8
@@ -0,0 +1,92 @@
+import struct
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from benchmarks.gif_factory import image_frame, make_gif, palette
+from gif_compositor import FrameCompositor
+
+PALETTE = [(0, 0, 0), (255, 0, 0), (0, 255, 0), (0, 0, 255)]
+
+
+def write_gif(path, *frames, width=4, height=4):
+    path.write_bytes(
+        b"GIF89a" + struct.pack("<HHBBB", width, height, 0xF1, 0, 0) +
+        bytes(c for rgb in PALETTE for c in rgb) + b"".join(frames) + b"\x3B"
+    )
+    return FrameCompositor.open(path)
+
+
+def rgba(color):
+    return [*PALETTE[color], 255]
+
+
+def test_do_not_dispose_keeps_pixels(tmp_path):
+    comp = write_gif(tmp_path / "a.gif", image_frame(0, 0, 4, 4, 1), image_frame(1, 1, 2, 2, 2))
+
+    canvas = comp.render(1)
+
+    assert canvas[0, 0].tolist() == rgba(1)
+    assert canvas[1, 1].tolist() == rgba(2)
+
+
+def test_restore_to_background_clears_only_the_frame_rect(tmp_path):
+    comp = write_gif(tmp_path / "a.gif", image_frame(0, 0, 4, 4, 1), image_frame(1, 1, 2, 2, 2, disposal=2),
+                     image_frame(0, 0, 1, 1, 3))
+
+    canvas = comp.render(2)
+
+    assert canvas[1, 1].tolist() == [0, 0, 0, 0]
+    assert canvas[3, 3].tolist() == rgba(1)
+    assert canvas[0, 0].tolist() == rgba(3)
+
+
+def test_restore_to_previous(tmp_path):
+    comp = write_gif(tmp_path / "a.gif", image_frame(0, 0, 4, 4, 1), image_frame(1, 1, 2, 2, 2, disposal=3),
+                     image_frame(0, 0, 1, 1, 3))
+
+    assert comp.render(1)[2, 2].tolist() == rgba(2)
+    canvas = comp.render(2)
+
+    assert canvas[2, 2].tolist() == rgba(1)
+    assert canvas[0, 0].tolist() == rgba(3)
+
+
+def test_transparent_index_is_not_drawn(tmp_path):
+    comp = write_gif(tmp_path / "a.gif", image_frame(0, 0, 4, 4, 1), image_frame(0, 0, 4, 4, 2, transparent=2))
+
+    assert comp.render(1)[0, 0].tolist() == rgba(1)
+
+
+def test_frames_outside_canvas_are_clipped(tmp_path):
+    comp = write_gif(tmp_path / "a.gif", image_frame(2, 2, 4, 4, 3), image_frame(9, 9, 1, 1, 2))
+
+    canvas = comp.render(1)
+
+    assert canvas[3, 3].tolist() == rgba(3)
+    assert canvas[1, 1].tolist() == [0, 0, 0, 0]
+
+
+def test_render_rewinds_for_earlier_frames(tmp_path):
+    comp = write_gif(tmp_path / "a.gif", image_frame(0, 0, 4, 4, 1), image_frame(0, 0, 4, 4, 2))
+
+    comp.render(1)
+
+    assert comp.render(0)[0, 0].tolist() == rgba(1)
+    with pytest.raises(IndexError):
+        comp.render(2)
+
+
+@pytest.mark.parametrize("interlaced", [False, True])
+def test_generated_local_palettes_and_interlacing(tmp_path, interlaced):
+    path = tmp_path / "generated.gif"
+    path.write_bytes(make_gif(11, 9, 3, palette_size=16, variants=2, local_palettes=True,
+                              interlaced=interlaced, comment="benchmark", app_extensions=2))
+
+    compositor = FrameCompositor.open(path)
+    for n, canvas in enumerate(compositor):
+        colors = palette(16, seed=n + 1)
+        for y, x in ((0, 0), (3, 7), (8, 10)):
+            index = (x + y + n % 2) % 16
+            assert tuple(canvas[y, x]) == (*colors[3 * index:3 * index + 3], 255)
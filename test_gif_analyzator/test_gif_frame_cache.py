@@ -0,0 +1,71 @@
+import random
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from gif_compositor import FrameCompositor
+from gif_frame_cache import FrameCache
+
+TEST_GIFS = Path(__file__).parent.parent / "test_gifs"
+
+
+@pytest.fixture
+def reference():
+    return [canvas.copy() for canvas in FrameCompositor.open(TEST_GIFS / "20fps.gif")]
+
+
+def test_frames_are_composited_on_demand(reference):
+    cache = FrameCache(FrameCompositor.open(TEST_GIFS / "20fps.gif"))
+
+    assert len(cache) == 66
+    assert cache.misses == 0
+    assert np.array_equal(cache[40], reference[40])
+    assert cache.compositor.position == 40
+
+
+def test_random_access_matches_sequential_compositing(reference):
+    compositor = FrameCompositor.open(TEST_GIFS / "20fps.gif")
+    cache = FrameCache(compositor, budget_bytes=4 * compositor.canvas.nbytes, keyframe_interval=8)
+    order = list(range(66)) * 2
+    random.Random(0).shuffle(order)
+
+    for n in order:
+        assert np.array_equal(cache[n], reference[n]), n
+
+
+def test_budget_evicts_least_recently_used(reference):
+    compositor = FrameCompositor.open(TEST_GIFS / "20fps.gif")
+    cache = FrameCache(compositor, budget_bytes=4 * compositor.canvas.nbytes, keyframe_interval=8)
+
+    assert cache.capacity == 3
+    for n in (0, 1, 2):
+        cache[n]
+    cache[0]
+    cache[3]
+
+    assert 0 in cache and 1 not in cache
+    assert cache.hits == 1
+
+
+def test_seeking_resumes_from_keyframe(reference):
+    compositor = FrameCompositor.open(TEST_GIFS / "20fps.gif")
+    cache = FrameCache(compositor, keyframe_interval=8)
+    cache[65]
+    cache.clear()
+
+    advanced = []
+    original = compositor.advance
+    compositor.advance = lambda: advanced.append(1) or original()
+
+    assert np.array_equal(cache[60], reference[60])
+    assert len(advanced) == 60 - 56
+
+
+def test_index_out_of_range():
+    cache = FrameCache(FrameCompositor.open(TEST_GIFS / "1x1.gif"))
+
+    assert cache[-1] is cache[0]
+    with pytest.raises(IndexError):
+        cache[1]
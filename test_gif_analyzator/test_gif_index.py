@@ -0,0 +1,149 @@
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from gif_index import FrameIndex, FrameInfoView, frame_info
+from benchmarks.gif_factory import make_gif
+from gif_lzw import read_image_data
+from gif_parser import GifParser
+
+TEST_GIFS = Path(__file__).parent.parent / "test_gifs"
+
+
+@pytest.fixture
+def gif_copy(tmp_path):
+    path = tmp_path / "20fps.gif"
+    shutil.copy(TEST_GIFS / "20fps.gif", path)
+    return path
+
+
+def test_frame_records_point_at_blocks():
+    path = TEST_GIFS / "transparent.gif"
+    data = path.read_bytes()
+    parser = GifParser(path)
+    parser.parse_file()
+
+    assert len(parser.frame_index) == 2
+    for n in range(2):
+        record = parser.get_frame_record(n)
+        assert data[record.gce_offset:record.gce_offset + 2] == b"\x21\xf9"
+        assert data[record.descriptor_offset] == 0x2C
+        assert record.color_table_offset == -1
+        assert record.data_offset == record.descriptor_offset + 10
+        assert data[record.data_end - 1] == 0
+
+    first = parser.get_frame_record(0)
+    assert (first.left, first.top, first.width, first.height) == (1, 5, 107, 107)
+    assert first.delay == 10
+    assert first.disposal_method == 2
+    assert parser.get_frame_record(-1).data_end < len(data)
+
+
+def test_get_frame_record_scans_on_demand():
+    parser = GifParser(TEST_GIFS / "20fps.gif")
+
+    record = parser.get_frame_record(65)
+
+    assert record.width == record.height == 48
+    with pytest.raises(IndexError):
+        parser.get_frame_record(66)
+
+
+def test_sidecar_round_trip(gif_copy, monkeypatch):
+    parser = GifParser(gif_copy, index_sidecar=True)
+    parser.parse_file()
+    assert parser.sidecar_path.exists()
+
+    reopened = GifParser(gif_copy, index_sidecar=True)
+    monkeypatch.setattr(GifParser, "parse_file", lambda self: pytest.fail("sidecar was not used"))
+
+    assert reopened.get_frame_record(10) == parser.get_frame_record(10)
+    assert len(reopened.frame_index) == 66
+
+
+def test_stale_sidecar_is_ignored(gif_copy):
+    GifParser(gif_copy, index_sidecar=True).parse_file()
+    stat = gif_copy.stat()
+    os.utime(gif_copy, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert FrameIndex.load(gif_copy.with_name(gif_copy.name + ".idx"),
+                           (stat.st_size, stat.st_mtime_ns + 1_000_000_000)) is None
+    assert len(GifParser(gif_copy, index_sidecar=True).load_frame_index()) == 66
+
+
+def test_frames_info_is_a_lazy_view_over_the_index():
+    parser = GifParser(TEST_GIFS / "transparent.gif")
+    info = parser.parse_file()
+
+    frames = info['frames']
+    assert isinstance(frames, FrameInfoView)
+    assert len(frames) == 2
+    assert frames[0] == {
+        'Position': (1, 5),
+        'Size': '107x107',
+        'Local Color Table': False,
+        'Interlaced': False,
+        'Sort Flag': False,
+        'Color Table Size': 2,
+        'Delay': '100ms',
+        'Disposal Method': 'Restore to background',
+        'User Input': False,
+        'Transparency': True,
+        'Transparent Color': 85,
+    }
+    assert frames[-1] == frames[1] == frame_info(parser.frame_index.record(1))
+    assert frames[:1] == [frames[0]]
+    assert frames == list(frames)
+    with pytest.raises(IndexError):
+        frames[2]
+
+
+def test_frame_info_without_graphics_control_has_no_timing_keys():
+    index = FrameIndex()
+    index.append(-1, 0, -1, 10, 20, 0, 0, 4, 4, 0b10000001, 0, 0, 0, 8, 1, 2)
+
+    info = frame_info(index.record(0))
+    assert info['Local Color Table'] is True
+    assert info['Color Table Size'] == 4
+    assert 'Delay' not in info
+
+
+def test_append_requires_every_column():
+    index = FrameIndex()
+    with pytest.raises(TypeError):
+        index.append(-1, 0, -1, 10, 20, 0, 0, 4, 4, 0b10000001, 0, 0, 0)
+    assert len(index) == 0
+
+
+@pytest.mark.parametrize("name", ["1x1.gif", "20fps.gif", "transparent.gif"])
+def test_compression_metrics_match_image_data(name):
+    parser = GifParser(TEST_GIFS / name)
+    parser.parse_file()
+
+    for n in range(len(parser.frame_index)):
+        record = parser.get_frame_record(n)
+        assert record.compressed_size == len(read_image_data(parser.buffer, record))
+        assert record.min_code_size == parser.buffer[record.data_offset]
+        assert record.sub_block_count == -(-record.compressed_size // 255)
+
+
+def test_sub_blocks_are_counted(tmp_path):
+    path = tmp_path / "small_blocks.gif"
+    path.write_bytes(make_gif(32, 32, 3, sub_block_size=16))
+    parser = GifParser(path)
+    parser.parse_file()
+
+    record = parser.get_frame_record(0)
+    assert record.sub_block_count == -(-record.compressed_size // 16)
+    assert record.data_end - record.data_offset == record.compressed_size + record.sub_block_count + 2
+
+
+def test_heaviest_orders_frames_by_compressed_size():
+    index = FrameIndex()
+    for size in (10, 30, 20):
+        index.append(-1, 0, -1, 0, 0, 0, 0, 4, 4, 0, 0, 0, 0, size, 1, 2)
+
+    assert index.heaviest(2) == [1, 2]
+    assert index.heaviest(10) == [1, 2, 0]
@@ -0,0 +1,44 @@
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from gif_loader import GifLoader
+
+TEST_GIFS = Path(__file__).parent.parent / "test_gifs"
+
+
+def test_loader_reports_parse_then_progress():
+    loader = GifLoader(TEST_GIFS / "20fps.gif")
+    loader.start()
+    loader.join()
+
+    events = loader.drain()
+    kind, info, frames = events[0]
+
+    assert kind == "parsed"
+    assert info["frame_count"] == 66
+    assert len(frames) == 66
+    assert [event[1] for event in events[1:-1]] == list(range(1, 67))
+    assert events[-1] == ("done",)
+    assert 0 in frames and 65 in frames
+
+
+def test_cancelled_loader_stops_before_compositing():
+    loader = GifLoader(TEST_GIFS / "20fps.gif")
+    loader.cancel()
+    loader.start()
+    loader.join()
+
+    assert loader.drain() == []
+
+
+def test_loader_reports_errors(tmp_path):
+    loader = GifLoader(tmp_path / "missing.gif")
+    loader.start()
+    loader.join()
+
+    kind, message = loader.drain()[0]
+    assert kind == "error"
+    assert "not found" in message
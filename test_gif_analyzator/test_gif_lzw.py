@@ -0,0 +1,94 @@
+import struct
+
+import pytest
+
+from benchmarks.gif_factory import lzw_encode, make_gif, sub_blocks
+import gif_lzw
+from gif_lzw import LzwDecoder, default_decoder, interlaced_rows
+from gif_parser import GifParser
+
+
+@pytest.fixture(params=["LzwDecoder", "PillowLzwDecoder"])
+def decoder_class(request):
+    if request.param == "PillowLzwDecoder":
+        pytest.importorskip("PIL.Image")
+    return getattr(gif_lzw, request.param)
+
+
+def pattern(width, height, colors, variant=0):
+    return bytes((x + y + variant) % colors for y in range(height) for x in range(width))
+
+
+def write_single_frame(path, width, height, pixels, interlaced=False):
+    rows = interlaced_rows(height) if interlaced else range(height)
+    stream = b"".join(pixels[row * width:(row + 1) * width] for row in rows)
+    path.write_bytes(
+        b"GIF89a" + struct.pack("<HHBBB", width, height, 0xF3, 0, 0) + bytes(48) +
+        struct.pack("<BHHHHB", 0x2C, 0, 0, width, height, 0x40 if interlaced else 0) +
+        bytes([4]) + sub_blocks(lzw_encode(stream, 4), 31) + b"\x3B"
+    )
+    return path
+
+
+@pytest.mark.parametrize("colors", [2, 4, 16, 256])
+def test_decode_generated_frames(tmp_path, colors, decoder_class):
+    path = tmp_path / "anim.gif"
+    path.write_bytes(make_gif(37, 23, 3, palette_size=colors, sub_block_size=17))
+    data = path.read_bytes()
+    parser = GifParser(path)
+    decoder = decoder_class()
+    out = bytearray(37 * 23)
+
+    for n in range(3):
+        assert decoder.decode_frame(data, parser.get_frame_record(n), out) is out
+        assert out == pattern(37, 23, colors, n)
+
+
+def test_decode_interlaced_frame(tmp_path, decoder_class):
+    pixels = pattern(19, 21, 16)
+    path = write_single_frame(tmp_path / "interlaced.gif", 19, 21, pixels, interlaced=True)
+    record = GifParser(path).get_frame_record(0)
+
+    assert record.interlaced
+    assert decoder_class().decode_frame(path.read_bytes(), record) == pixels
+
+
+def test_decode_selected_rows(tmp_path, decoder_class):
+    pixels = pattern(19, 21, 16)
+    path = write_single_frame(tmp_path / "interlaced.gif", 19, 21, pixels, interlaced=True)
+    record = GifParser(path).get_frame_record(0)
+
+    out = decoder_class().decode_frame(path.read_bytes(), record, bytearray(19 * 21), rows=[0, 8])
+
+    assert out[:19] == pixels[:19]
+    assert out[8 * 19:9 * 19] == pixels[8 * 19:9 * 19]
+    assert out[19:2 * 19] == bytes(19)
+
+
+def test_decode_into_numpy_buffer(tmp_path, decoder_class):
+    np = pytest.importorskip("numpy")
+    pixels = pattern(19, 21, 16)
+    path = write_single_frame(tmp_path / "frame.gif", 19, 21, pixels)
+    out = np.zeros((21, 19), dtype=np.uint8)
+
+    decoder_class().decode_frame(path.read_bytes(), GifParser(path).get_frame_record(0), out)
+
+    assert out.tobytes() == pixels
+    assert out[1, 0] == 1
+
+
+def test_truncated_data_keeps_decoded_prefix(tmp_path, decoder_class):
+    pixels = pattern(40, 40, 16)
+    path = write_single_frame(tmp_path / "frame.gif", 40, 40, pixels)
+    data = path.read_bytes()
+    record = GifParser(path).get_frame_record(0)
+
+    out = decoder_class().decode_frame(data[:record.data_offset + 200], record)
+
+    assert out[:100] == pixels[:100]
+
+
+def test_default_decoder_uses_pillow_when_available():
+    pytest.importorskip("PIL.Image")
+
+    assert isinstance(default_decoder(), gif_lzw.PillowLzwDecoder)
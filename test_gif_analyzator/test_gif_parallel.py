@@ -0,0 +1,104 @@
+import struct
+from concurrent.futures import CancelledError
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import gif_loader
+from benchmarks.gif_factory import image_frame, make_gif
+from gif_compositor import FrameCompositor
+from gif_loader import GifLoader
+from gif_parallel import decode_frames, find_keyframes, split_segments
+from gif_parser import GifParser
+
+PALETTE = bytes([0, 0, 0, 255, 0, 0, 0, 255, 0, 0, 0, 255])
+
+
+@pytest.fixture
+def mixed_gif(tmp_path):
+    frames = [
+        image_frame(0, 0, 8, 8, 1, colors=4),
+        image_frame(2, 2, 3, 3, 2, colors=4),
+        image_frame(0, 0, 8, 8, 3, transparent=0, colors=4),
+        image_frame(0, 0, 8, 8, 1, disposal=2, transparent=1, colors=4),
+        image_frame(1, 1, 4, 4, 2, colors=4),
+        image_frame(0, 0, 8, 8, 2, disposal=3, colors=4),
+        image_frame(4, 4, 4, 4, 3, transparent=3, colors=4),
+        image_frame(0, 0, 8, 8, 0, colors=4),
+        image_frame(3, 0, 5, 8, 1, disposal=2, colors=4),
+    ] * 3
+    path = tmp_path / "mixed.gif"
+    path.write_bytes(b"GIF89a" + struct.pack("<HHBBB", 8, 8, 0xF1, 0, 0) + PALETTE + b"".join(frames) + b"\x3B")
+    return path
+
+
+def test_keyframes_reset_the_canvas(mixed_gif):
+    parser = GifParser(mixed_gif)
+    parser.parse_file()
+
+    assert find_keyframes(parser.frame_index, 8, 8) == [0, 4, 7, 9, 13, 16, 18, 22, 25]
+
+
+def test_segments_start_at_keyframes():
+    assert split_segments([0, 4, 7, 9, 13], 16, 4) == [(0, 4), (4, 9), (9, 13), (13, 16)]
+    assert split_segments([0], 16, 4) == [(0, 16)]
+    assert split_segments([], 0, 4) == []
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parallel_decode_matches_sequential(mixed_gif, workers):
+    reference = [canvas.copy() for canvas in FrameCompositor.open(mixed_gif)]
+
+    with decode_frames(mixed_gif, workers, segments_per_worker=3) as decoded:
+        assert len(decoded) == len(reference)
+        for n, canvas in enumerate(reference):
+            assert np.array_equal(decoded[n], canvas), n
+
+
+def test_parallel_decode_of_in_memory_source(tmp_path):
+    data = make_gif(16, 12, 12, palette_size=16, variants=3)
+    path = tmp_path / "many.gif"
+    path.write_bytes(data)
+    reference = [canvas.copy() for canvas in FrameCompositor.open(path)]
+
+    with decode_frames(data, workers=2) as decoded:
+        assert all(np.array_equal(decoded[n], reference[n]) for n in range(12))
+
+
+def test_loader_uses_parallel_decode_for_long_animations(tmp_path, monkeypatch):
+    path = tmp_path / "long.gif"
+    path.write_bytes(make_gif(16, 16, 20, palette_size=16))
+    monkeypatch.setattr(gif_loader, "PARALLEL_MIN_FRAMES", 8)
+    reference = [canvas.copy() for canvas in FrameCompositor.open(path)]
+
+    loader = GifLoader(path, workers=2)
+    loader.start()
+    loader.join()
+
+    events = loader.drain()
+    _, _, frames = events[0]
+    assert [event[1] for event in events[1:-1]] == list(range(1, 21))
+    assert events[-1] == ("done",)
+    assert all(np.array_equal(frames[n], reference[n]) for n in range(20))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_cancelled_decode_raises(mixed_gif, workers):
+    with pytest.raises(CancelledError):
+        decode_frames(mixed_gif, workers, segments_per_worker=3, cancelled=lambda: True)
+
+
+def test_loader_cancel_stops_parallel_decode(tmp_path, monkeypatch):
+    path = tmp_path / "long.gif"
+    path.write_bytes(make_gif(16, 16, 400, palette_size=16))
+    monkeypatch.setattr(gif_loader, "PARALLEL_MIN_FRAMES", 8)
+
+    loader = GifLoader(path, workers=2)
+    loader.start()
+    assert loader.events.get(timeout=10)[0] == "parsed"
+    loader.cancel()
+    loader.join(timeout=10)
+
+    assert not loader.is_alive()
+    assert ("done",) not in loader.drain()
@@ -0,0 +1,90 @@
+import pytest
+
+from gif_playback import PlaybackScheduler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_uses_per_frame_delays(clock):
+    scheduler = PlaybackScheduler([100, 50, 200], clock=clock)
+    scheduler.start(0)
+    assert scheduler.wait_ms() == 100
+
+    clock.now += 0.1
+    assert scheduler.advance() == 1
+    assert scheduler.wait_ms() == 50
+
+    clock.now += 0.05
+    assert scheduler.advance() == 2
+    assert scheduler.wait_ms() == 200
+
+
+def test_deadlines_do_not_drift(clock):
+    scheduler = PlaybackScheduler([40] * 10, clock=clock)
+    scheduler.start(0)
+
+    clock.now += 0.045
+    scheduler.advance()
+
+    assert scheduler.wait_ms() == 35
+
+
+def test_skips_frames_when_behind(clock):
+    scheduler = PlaybackScheduler([50] * 10, clock=clock)
+    scheduler.start(0)
+
+    clock.now += 0.175
+    assert scheduler.advance() == 3
+    assert scheduler.skipped == 2
+    assert scheduler.wait_ms() == 25
+
+
+def test_zero_delays_use_default(clock):
+    scheduler = PlaybackScheduler([0, 0], clock=clock)
+    scheduler.start(0)
+
+    assert scheduler.wait_ms() == 100
+    assert scheduler.intended_fps() == pytest.approx(10.0)
+
+
+def test_speed_scales_delays_and_fps(clock):
+    scheduler = PlaybackScheduler([100] * 4, speed=2.0, clock=clock)
+    scheduler.start(0)
+    assert scheduler.wait_ms() == 50
+
+    scheduler.set_speed(0.5)
+    assert scheduler.wait_ms() == 200
+    assert scheduler.intended_fps() == pytest.approx(5.0)
+
+
+def test_wraps_at_limit_and_reports_achieved_fps(clock):
+    scheduler = PlaybackScheduler([50] * 10, clock=clock)
+    scheduler.start(0)
+
+    for expected in (1, 2, 0, 1):
+        clock.now += 0.05
+        assert scheduler.advance(limit=3) == expected
+
+    assert scheduler.achieved_fps() == pytest.approx(20.0)
+    assert scheduler.intended_fps() == pytest.approx(20.0)
+
+
+def test_achieved_fps_drops_when_frames_are_skipped(clock):
+    scheduler = PlaybackScheduler([50] * 10, clock=clock)
+    scheduler.start(0)
+
+    clock.now += 0.1
+    scheduler.advance()
+
+    assert scheduler.achieved_fps() == pytest.approx(10.0)
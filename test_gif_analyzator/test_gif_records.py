@@ -0,0 +1,151 @@
+import io
+import json
+import struct
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from gif_parser import GifParser
+from gif_records import JsonLinesWriter, MsgpackWriter, error_record, iter_records, pack
+
+
+TEST_GIFS = Path(__file__).parent.parent / "test_gifs"
+
+_FLOAT64 = struct.Struct(">d")
+
+
+def unpack_stream(data: bytes) -> Iterator:
+    view = memoryview(data)
+    pos = 0
+    while pos < len(view):
+        obj, pos = _unpack_from(view, pos)
+        yield obj
+
+
+_FIXED_INTS = {
+    0xCC: struct.Struct(">B"), 0xCD: struct.Struct(">H"), 0xCE: struct.Struct(">I"), 0xCF: struct.Struct(">Q"),
+    0xD0: struct.Struct(">b"), 0xD1: struct.Struct(">h"), 0xD2: struct.Struct(">i"), 0xD3: struct.Struct(">q"),
+}
+_LENGTHS = {
+    0xD9: ('str', ">B"), 0xDA: ('str', ">H"), 0xDB: ('str', ">I"),
+    0xC4: ('bin', ">B"), 0xC5: ('bin', ">H"), 0xC6: ('bin', ">I"),
+    0xDC: ('array', ">H"), 0xDD: ('array', ">I"),
+    0xDE: ('map', ">H"), 0xDF: ('map', ">I"),
+}
+
+
+def _unpack_from(view: memoryview, pos: int):
+    code = view[pos]
+    pos += 1
+    if code < 0x80:
+        return code, pos
+    if code >= 0xE0:
+        return code - 0x100, pos
+    if code == 0xC0:
+        return None, pos
+    if code in (0xC2, 0xC3):
+        return code == 0xC3, pos
+    if code == 0xCB:
+        return _FLOAT64.unpack_from(view, pos)[0], pos + _FLOAT64.size
+    if code in _FIXED_INTS:
+        layout = _FIXED_INTS[code]
+        return layout.unpack_from(view, pos)[0], pos + layout.size
+
+    if 0xA0 <= code < 0xC0:
+        kind, length = 'str', code & 0x1F
+    elif 0x90 <= code < 0xA0:
+        kind, length = 'array', code & 0x0F
+    elif 0x80 <= code < 0x90:
+        kind, length = 'map', code & 0x0F
+    elif code in _LENGTHS:
+        kind, fmt = _LENGTHS[code]
+        length = struct.unpack_from(fmt, view, pos)[0]
+        pos += struct.calcsize(fmt)
+    else:
+        raise ValueError(f"Unsupported type code 0x{code:02X} at offset {pos - 1}")
+
+    if kind == 'str':
+        return bytes(view[pos:pos + length]).decode('utf-8'), pos + length
+    if kind == 'bin':
+        return bytes(view[pos:pos + length]), pos + length
+    if kind == 'array':
+        items = []
+        for _ in range(length):
+            item, pos = _unpack_from(view, pos)
+            items.append(item)
+        return items, pos
+
+    result = {}
+    for _ in range(length):
+        key, pos = _unpack_from(view, pos)
+        result[key], pos = _unpack_from(view, pos)
+    return result, pos
+
+
+@pytest.fixture
+def parsed():
+    parser = GifParser(TEST_GIFS / "transparent.gif")
+    parser.parse_file()
+    return parser
+
+
+def test_records_have_typed_fields(parsed):
+    file_record, *frames = iter_records(parsed)
+
+    assert file_record['type'] == 'file'
+    assert (file_record['width'], file_record['height']) == (108, 112)
+    assert file_record['frame_count'] == 2
+    assert file_record['duration_ms'] == 200
+    assert file_record['loop_count'] == 0
+
+    assert len(frames) == 2
+    assert frames[0]['delay_ms'] == 100
+    assert (frames[0]['left'], frames[0]['top'], frames[0]['width'], frames[0]['height']) == (1, 5, 107, 107)
+    assert frames[0]['disposal_method'] == 2
+    assert frames[0]['transparent_index'] == 85
+    assert frames[1]['offset'] == frames[0]['data_end'] + 8
+    assert frames[0]['min_code_size'] == 8
+    assert frames[0]['compressed_size'] > 0
+    assert frames[0]['bytes_per_pixel'] == frames[0]['compressed_size'] / (107 * 107)
+
+
+def test_jsonl_writer_emits_one_record_per_line(parsed):
+    out = io.StringIO()
+    writer = JsonLinesWriter(out)
+    for record in iter_records(parsed):
+        writer.write(record)
+
+    lines = out.getvalue().splitlines()
+    assert [json.loads(line)['type'] for line in lines] == ['file', 'frame', 'frame']
+
+
+def test_msgpack_writer_round_trip(parsed):
+    out = io.BytesIO()
+    writer = MsgpackWriter(out)
+    records = list(iter_records(parsed)) + [error_record('missing.gif', 'not found')]
+    for record in records:
+        writer.write(record)
+
+    assert list(unpack_stream(out.getvalue())) == records
+
+
+@pytest.mark.parametrize("value, encoded", [
+    (None, b'\xc0'),
+    (True, b'\xc3'),
+    (5, b'\x05'),
+    (-1, b'\xff'),
+    (300, b'\xcd\x01\x2c'),
+    (-200, b'\xd1\xff\x38'),
+    ('ab', b'\xa2ab'),
+    ([1, 2], b'\x92\x01\x02'),
+    ({'a': 1}, b'\x81\xa1a\x01'),
+])
+def test_pack_uses_compact_encodings(value, encoded):
+    assert pack(value) == encoded
+    assert list(unpack_stream(encoded)) == [value]
+
+
+def test_pack_large_containers_round_trip():
+    value = {'items': list(range(-40, 70000, 997)), 'text': 'x' * 70000, 'blob': b'\x00' * 300, 'ratio': 0.25}
+    assert list(unpack_stream(pack(value))) == [value]
@@ -0,0 +1,79 @@
+from pathlib import Path
+
+import pytest
+
+from gif_parser import GifParser
+from gif_stream import GifStreamParser
+
+
+TEST_GIFS = Path(__file__).parent.parent / "test_gifs"
+
+
+def feed_in_chunks(data: bytes, chunk_size: int):
+    parser = GifStreamParser()
+    events = []
+    for start in range(0, len(data), chunk_size):
+        events.extend(parser.feed(data[start:start + chunk_size]))
+    return parser, events
+
+
+@pytest.mark.parametrize("name", ["1x1.gif", "20fps.gif", "transparent.gif"])
+@pytest.mark.parametrize("chunk_size", [1, 13, 4096])
+def test_stream_matches_file_parser(name, chunk_size):
+    data = (TEST_GIFS / name).read_bytes()
+    reference = GifParser(TEST_GIFS / name)
+    reference.parse_file()
+
+    parser, events = feed_in_chunks(data, chunk_size)
+    parser.close()
+
+    assert parser.finished
+    assert parser.frame_index.columns == reference.frame_index.columns
+    assert parser.total_duration == reference.total_duration
+    assert events[0][0] == 'header'
+    assert events[-1] == ('end',)
+    assert [event[1] for event in events if event[0] == 'frame'] == list(range(reference.frame_count))
+
+
+def test_header_event_arrives_before_frame_data():
+    data = (TEST_GIFS / "transparent.gif").read_bytes()
+    parser = GifStreamParser()
+
+    assert parser.feed(data[:12]) == []
+    events = parser.feed(data[12:13])
+    assert events == [('header', {'version': '89a', 'width': 108, 'height': 112,
+                                  'global_color_table_size': 256, 'background_color': 85})]
+
+
+def test_frame_event_is_emitted_when_its_data_completes():
+    data = (TEST_GIFS / "transparent.gif").read_bytes()
+    reference = GifParser(TEST_GIFS / "transparent.gif")
+    reference.parse_file()
+    first_end = reference.frame_index.record(0).data_end
+
+    parser = GifStreamParser()
+    assert not any(event[0] == 'frame' for event in parser.feed(data[:first_end - 1]))
+    events = parser.feed(data[first_end - 1:first_end])
+    assert events == [('frame', 0, reference.frame_index.record(0))]
+
+
+def test_non_gif_is_rejected_after_three_bytes():
+    parser = GifStreamParser()
+    with pytest.raises(ValueError, match="Not a GIF"):
+        parser.feed(b"\x89PN")
+
+
+def test_truncated_stream_raises_on_close():
+    data = (TEST_GIFS / "20fps.gif").read_bytes()
+    parser, events = feed_in_chunks(data[:len(data) // 2], 512)
+
+    assert 0 < parser.frame_count < 66
+    with pytest.raises(ValueError, match="Truncated"):
+        parser.close()
+
+
+def test_unexpected_block_is_rejected():
+    data = (TEST_GIFS / "1x1.gif").read_bytes()
+    parser = GifStreamParser()
+    with pytest.raises(ValueError, match="Unexpected block"):
+        parser.feed(data[:-1] + b"\x99")